@@ -1,11 +1,12 @@
 """Data ingestion component.
 
-Pulls admissions data from MongoDB into a feature-store CSV and creates train/test splits.
+Pulls admissions data from MongoDB into a feature store and creates train/test splits.
 
-- export_to_feature_store: read MongoDB and persist raw CSV.
-- dataset_split: split DataFrame and persist train/test CSVs.
+- export_to_feature_store: read MongoDB and persist the raw table.
+- dataset_split: split DataFrame and persist train/test tables.
 - init_data_ingestion: orchestrate ingestion and return DAArtifacts.
-- Writes CSVs to paths defined in DataIngestionConfig.
+- Writes CSV/Parquet/Feather (DataIngestionConfig.artifact_format) to the
+  paths defined in DataIngestionConfig.
 - Logs progress.
 
 Raises:
@@ -15,14 +16,18 @@ Raises:
 import os
 import sys
 import glob
-import pandas as pd
+from typing import Tuple
+
+import numpy as np
 from pandas import DataFrame
-from sklearn.model_selection import train_test_split
+from sklearn.model_selection import ShuffleSplit, StratifiedShuffleSplit
+from BIT_ADMIT_AI.constant import RANDOM_STATE, TARGET_COLUMNS
 from BIT_ADMIT_AI.entity.config import DataIngestionConfig, SystemConfig
 from BIT_ADMIT_AI.entity.artifact import DAArtifacts
 from BIT_ADMIT_AI.exceptions import BitAdmitAIException
 from BIT_ADMIT_AI.logger import logging
 from BIT_ADMIT_AI.data_access.data_access import DataAccessAndHandling
+from BIT_ADMIT_AI.utils.main_utils import read_csv_file, save_dataframe
 
 
 class DataIngestion:
@@ -48,11 +53,23 @@ class DataIngestion:
         """
         try:
             self.data_ingestion_config = data_ingestion_config
+            # Every output directory is fixed for the run; create them once here
+            # so the writers below can skip their per-call makedirs.
+            output_dirs = {
+                os.path.dirname(os.path.abspath(path))
+                for path in (
+                    data_ingestion_config.feature_store_dir,
+                    data_ingestion_config.training_file_path,
+                    data_ingestion_config.test_file_path,
+                )
+            }
+            for output_dir in output_dirs:
+                os.makedirs(output_dir, exist_ok=True)
         except Exception as e:
             raise BitAdmitAIException(e, sys)
 
     def export_to_feature_store(self):
-        """Export data to the feature store CSV with MongoDB→local fallback.
+        """Export data to the feature store with MongoDB→local fallback.
 
         Priority:
         1) If MONGODB_URL_KEY is provided, try reading from MongoDB.
@@ -79,11 +96,13 @@ class DataIngestion:
                         collection_name=self.data_ingestion_config.collection_name
                     )
                     logging.info(
-                        f"MongoDB export successful. DataFrame shape: {dataframe.shape}"
+                        "MongoDB export successful. DataFrame shape: %s",
+                        dataframe.shape,
                     )
                 except Exception as e:
                     logging.warning(
-                        f"MongoDB ingestion failed ({e}). Falling back to local CSV from 'original_dataset'."
+                        "MongoDB ingestion failed (%s). Falling back to local CSV from 'original_dataset'.",
+                        e,
                     )
                     dataframe = self._load_local_dataset()
             else:
@@ -94,10 +113,10 @@ class DataIngestion:
 
             # Persist to feature store
             feature_store_file_path = self.data_ingestion_config.feature_store_dir
-            dir_path = os.path.dirname(feature_store_file_path)
-            os.makedirs(dir_path, exist_ok=True)
-            logging.info(f"Saving exported data to feature store: {feature_store_file_path}")
-            dataframe.to_csv(feature_store_file_path, index=False, header=True)
+            logging.info(
+                "Saving exported data to feature store: %s", feature_store_file_path
+            )
+            save_dataframe(feature_store_file_path, dataframe, make_dirs=False)
             return dataframe
 
         except Exception as e:
@@ -132,39 +151,76 @@ class DataIngestion:
 
             # Pick the most recently modified CSV
             latest_csv = max(csv_files, key=os.path.getmtime)
-            logging.info(f"Loading local dataset from: {latest_csv}")
-            df = pd.read_csv(latest_csv)
-            logging.info(f"Local CSV load successful. DataFrame shape: {df.shape}")
+            logging.info("Loading local dataset from: %s", latest_csv)
+            df = read_csv_file(latest_csv)
+            logging.info("Local CSV load successful. DataFrame shape: %s", df.shape)
             return df
         except Exception as e:
             raise BitAdmitAIException(e, sys)
 
+    def _split_indices(self, dataframe: DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """Compute train/test row positions, stratified on the target columns.
+
+        Falls back to a plain shuffle split when targets are missing or a
+        target combination has fewer than two rows.
+
+        Args:
+            dataframe: Input DataFrame to split.
+
+        Returns:
+            Tuple of train and test positional indices.
+        """
+        test_ratio = self.data_ingestion_config.test_ratio
+        placeholder = np.zeros(len(dataframe))
+
+        if set(TARGET_COLUMNS).issubset(dataframe.columns):
+            strata = (
+                dataframe.groupby(TARGET_COLUMNS, sort=False, dropna=False)
+                .ngroup()
+                .to_numpy()
+            )
+            if np.bincount(strata).min() >= 2:
+                splitter = StratifiedShuffleSplit(
+                    n_splits=1, test_size=test_ratio, random_state=RANDOM_STATE
+                )
+                logging.info("Stratifying train test split on %s", TARGET_COLUMNS)
+                return next(splitter.split(placeholder, strata))
+
+        logging.info("Stratification not possible, using a shuffled split")
+        splitter = ShuffleSplit(
+            n_splits=1, test_size=test_ratio, random_state=RANDOM_STATE
+        )
+        return next(splitter.split(placeholder))
+
     def dataset_split(self, dataframe: DataFrame) -> None:
-        """Split the dataset into train and test and persist CSVs.
+        """Split the dataset into train and test and persist them.
+
+        Only index arrays are produced by the split; each partition is
+        materialized while it is written.
 
         Args:
             dataframe: Input DataFrame to split.
 
         Side Effects:
-            Writes train/test CSVs to training_file_path and test_file_path.
+            Writes train/test files to training_file_path and test_file_path.
 
         Raises:
             BitAdmitAIException: If split or file write fails.
         """
         logging.info("Entered dataset_split method")
         try:
-            train_set, test_set = train_test_split(
-                dataframe, test_size=self.data_ingestion_config.test_ratio
-            )
+            train_idx, test_idx = self._split_indices(dataframe)
             logging.info("Performed train test split")
-            dir_path = os.path.dirname(self.data_ingestion_config.training_file_path)
-            os.makedirs(dir_path, exist_ok=True)
 
-            train_set.to_csv(
-                self.data_ingestion_config.training_file_path, index=False, header=True
+            save_dataframe(
+                self.data_ingestion_config.training_file_path,
+                dataframe.iloc[train_idx],
+                make_dirs=False,
             )
-            test_set.to_csv(
-                self.data_ingestion_config.test_file_path, index=False, header=True
+            save_dataframe(
+                self.data_ingestion_config.test_file_path,
+                dataframe.iloc[test_idx],
+                make_dirs=False,
             )
 
             logging.info("Exported train and test file path.")
@@ -194,7 +250,7 @@ class DataIngestion:
                 test_file_path=self.data_ingestion_config.test_file_path,
             )
 
-            logging.info(f"Data ingestion artifact: {data_ingestion_artifact}")
+            logging.info("Data ingestion artifact: %s", data_ingestion_artifact)
             return data_ingestion_artifact
         except Exception as e:
             raise BitAdmitAIException(e, sys) from e
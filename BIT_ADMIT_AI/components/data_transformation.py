@@ -1,7 +1,7 @@
 """Data transformation component.
 
 Prepares model-ready arrays and persists transformation artifacts:
-- reads train/test CSVs,
+- reads train/test splits (CSV/Parquet/Feather),
 - engineers features and standardizes strings,
 - builds/fits a ColumnTransformer (num: impute+scale, cat: impute+OHE),
 - encodes target columns,
@@ -11,11 +11,16 @@ Relies on schema.yaml (columns, drops) and a passing DataValidationArtifact.
 Outputs are written to paths from DataTransformationConfig.
 """
 
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from scipy import sparse
 from sklearn.compose import ColumnTransformer
 from sklearn.impute import SimpleImputer
 from sklearn.pipeline import Pipeline
@@ -28,10 +33,14 @@ from BIT_ADMIT_AI.entity.artifact import (
     DataValidationArtifact,
 )
 from BIT_ADMIT_AI.entity.config import DataTransformationConfig
+from BIT_ADMIT_AI.entity.estimator import PreprocessorBundle
 from BIT_ADMIT_AI.exceptions import BitAdmitAIException
 from BIT_ADMIT_AI.logger import logging
 from BIT_ADMIT_AI.utils.main_utils import (
+    dataframe_fingerprint,
     drop_columns,
+    load_object,
+    read_dataframe,
     read_yaml_file,
     save_numpy_array_data,
     save_object,
@@ -41,6 +50,13 @@ from BIT_ADMIT_AI.utils.main_utils import (
 class DataTransformation:
     """Prepare feature/target arrays and persist preprocessing artifacts."""
 
+    # Categorical inputs normalised before feature engineering; never dropped.
+    STANDARDIZED_COLUMNS = ("program_category", "degree_language", "english_test_type")
+    # Dtype of the transformed feature/target arrays handed to the trainer.
+    ARRAY_DTYPE = np.float32
+    # Minimum passing english_score per test type; other types never pass.
+    ENGLISH_PASS_THRESHOLDS = {"duolingo": 90.0, "toefl": 90.0, "ielts": 6.5}
+
     def __init__(
         self,
         data_ingestion_artifact: DAArtifacts,
@@ -62,15 +78,31 @@ class DataTransformation:
             self.data_transformation_config = data_transformation_config
             self.data_validation_artifact = data_validation_artifact
             self._schema_config = read_yaml_file(file_path=SCHEMA_PATH)
+
+            # Schema-derived column sets, built once and reused for train/test.
+            dropped = frozenset(self._schema_config.get("dropped_columns", []))
+            protected = frozenset(self._schema_config.get("target_columns", []))
+            self._droppable_columns = (
+                dropped - protected - set(self.STANDARDIZED_COLUMNS)
+            )
+            self._numeric_schema = tuple(
+                self._schema_config.get("numerical_columns", [])
+                + self._schema_config.get("engineered_columns", [])
+            )
+            self._categorical_schema = tuple(
+                col
+                for col in self._schema_config.get("categorical_columns", [])
+                if col not in TARGET_COLUMNS and col not in dropped
+            )
         except Exception as exc:  # pragma: no cover - setup failure
             raise BitAdmitAIException(exc, sys) from exc
 
     @staticmethod
     def read_data(file_path: str) -> pd.DataFrame:
-        """Read a CSV into a DataFrame.
+        """Read a train/test split into a DataFrame.
 
         Args:
-            file_path: Path to the CSV.
+            file_path: Path to the CSV, Parquet or Feather file.
 
         Returns:
             pandas.DataFrame: Loaded data.
@@ -79,95 +111,160 @@ class DataTransformation:
             BitAdmitAIException: If read fails.
         """
         try:
-            return pd.read_csv(file_path)
+            return read_dataframe(file_path)
         except Exception as exc:
             raise BitAdmitAIException(exc, sys) from exc
 
+    @staticmethod
+    def _normalize_arrow_strings(series: pd.Series) -> pa.Array:
+        # strip/lower/replace run back to back as Arrow compute kernels on the
+        # column buffer; missing values keep the "nan" token the former
+        # astype(str) produced.
+        values = pa.array(series.astype("string[pyarrow]"))
+        values = pc.utf8_lower(pc.utf8_trim_whitespace(pc.fill_null(values, "nan")))
+        return pc.replace_substring(values, "-", "_")
+
     @staticmethod
     def _standardize_strings(series: pd.Series) -> pd.Series:
-        return series.astype(str).str.strip().str.lower().str.replace("-", "_")
+        values = DataTransformation._normalize_arrow_strings(series)
+        return pd.Series(
+            pd.arrays.ArrowStringArray(values), index=series.index, name=series.name
+        )
+
+    @staticmethod
+    def _column(df: pd.DataFrame, column: str, default):
+        # Missing columns fall back to a scalar that broadcasts in the kernels.
+        if column in df.columns:
+            return df[column]
+        return default
 
     @staticmethod
-    def _language_requirement_passed(row: pd.Series) -> int:
-        degree_language = row.get("degree_language", "")
-        english_type = row.get("english_test_type", "")
-        english_score = row.get("english_score", 0.0)
-        chinese_level = row.get("chinese_proficiency", 0)
-
-        if degree_language == "english_taught":
-            if english_type == "duolingo" and english_score >= 90:
-                return 1
-            if english_type == "toefl" and english_score >= 90:
-                return 1
-            if english_type == "ielts" and english_score >= 6.5:
-                return 1
-            return 0
-
-        if degree_language == "chinese_taught":
-            return 1 if chinese_level >= 4 else 0
-
-        return 0
+    def _numeric(df: pd.DataFrame, column: str, default: float = 0.0):
+        if column in df.columns:
+            return df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+        return default
 
     @staticmethod
-    def _weighted_score(row: pd.Series) -> float:
-        category = row.get("program_category", "")
-        gpa = row.get("previous_gpa", 0.0)
-        math_phys = row.get("math_physics_background_score", 0.0)
-        research_alignment = row.get("research_alignment_score", 0.0)
-        publications = min(row.get("publication_count", 0.0), 5.0)
-        recommendation = row.get("recommendation_strength", 0.0)
-        interview = row.get("interview_score", 0.0)
-
-        if category == "undergraduate":
-            return (
-                0.40 * gpa + 0.30 * math_phys + 0.10 * recommendation + 0.20 * interview
+    def _language_requirement_passed(
+        degree_language, english_type, english_score, chinese_level
+    ) -> np.ndarray:
+        """Vectorized language requirement check.
+
+        Accepts scalars, NumPy arrays or Series (``english_type`` as a Series
+        or scalar). The English check maps each test type to its threshold
+        and does a single comparison instead of OR-ing one mask per type.
+        """
+        thresholds = DataTransformation.ENGLISH_PASS_THRESHOLDS
+        if isinstance(english_type, pd.Series):
+            english_threshold = english_type.map(thresholds).to_numpy(
+                dtype=np.float64, na_value=np.nan
             )
+        else:
+            english_threshold = thresholds.get(english_type, np.nan)
+        # A NaN threshold (unknown test type) compares False.
+        english_passed = english_score >= english_threshold
+
+        return np.where(
+            np.asarray(degree_language == "english_taught", dtype=bool),
+            english_passed,
+            np.asarray(degree_language == "chinese_taught", dtype=bool)
+            & (chinese_level >= 4),
+        ).astype(np.int8)
 
-        if category == "postgraduate":
-            return (
+    @staticmethod
+    def _weighted_score(
+        category,
+        gpa,
+        math_phys,
+        research_alignment,
+        publications,
+        recommendation,
+        interview,
+    ) -> np.ndarray:
+        """Vectorized category-weighted score; accepts scalars or arrays."""
+        publications = np.minimum(publications, 5.0)
+
+        return np.select(
+            [
+                np.asarray(category == "undergraduate", dtype=bool),
+                np.asarray(category == "postgraduate", dtype=bool),
+            ],
+            [
+                0.40 * gpa
+                + 0.30 * math_phys
+                + 0.10 * recommendation
+                + 0.20 * interview,
                 0.40 * gpa
                 + 0.30 * research_alignment
                 + 0.10 * publications
                 + 0.10 * recommendation
-                + 0.10 * interview
+                + 0.10 * interview,
+            ],
+            # Chinese language & dual degree programs share weighting
+            default=0.50 * gpa + 0.20 * recommendation + 0.30 * interview,
+        )
+
+    @staticmethod
+    def _derive_features(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """Compute every derived column in a single pass over the frame.
+
+        Each input column is extracted once; the returned mapping is meant
+        to be applied with a single ``DataFrame.assign``.
+        """
+        column = DataTransformation._column
+        numeric = DataTransformation._numeric
+
+        derived: Dict[str, np.ndarray] = {}
+        publications = numeric(df, "publication_count")
+        if "publication_count" in df.columns:
+            publications = np.log1p(np.clip(publications, 0, None))
+            derived["publication_count"] = publications
+
+        derived["language_requirement_passed"] = (
+            DataTransformation._language_requirement_passed(
+                column(df, "degree_language", ""),
+                column(df, "english_test_type", ""),
+                numeric(df, "english_score"),
+                numeric(df, "chinese_proficiency"),
             )
+        )
+        derived["weighted_score"] = DataTransformation._weighted_score(
+            column(df, "program_category", ""),
+            numeric(df, "previous_gpa"),
+            numeric(df, "math_physics_background_score"),
+            numeric(df, "research_alignment_score"),
+            publications,
+            numeric(df, "recommendation_strength"),
+            numeric(df, "interview_score"),
+        )
+        return derived
 
-        # Chinese language & dual degree programs share weighting
-        return 0.50 * gpa + 0.20 * recommendation + 0.30 * interview
+    @staticmethod
+    def _parse_chinese_proficiency(series: pd.Series) -> pd.Series:
+        values = pc.replace_substring(
+            DataTransformation._normalize_arrow_strings(series), "hsk", ""
+        )
+        values = pc.if_else(pc.equal(values, ""), None, values)
+        levels = pc.cast(values, pa.float64()).to_numpy(zero_copy_only=False)
+        return pd.Series(levels, index=series.index, name=series.name)
 
     def _engineer_features(self, df: pd.DataFrame) -> pd.DataFrame:
-        processed = df.copy()
+        # Columns are only ever reassigned below, never mutated in place, so a
+        # shallow copy keeps the caller's frame intact without duplicating data.
+        processed = df.copy(deep=False)
 
-        for column in ["program_category", "degree_language", "english_test_type"]:
+        for column in self.STANDARDIZED_COLUMNS:
             if column in processed.columns:
                 processed[column] = self._standardize_strings(processed[column])
 
-        if "publication_count" in processed.columns:
-            processed["publication_count"] = np.log1p(
-                processed["publication_count"].clip(lower=0)
-            )
-
         if "chinese_proficiency" in processed.columns:
-            processed["chinese_proficiency"] = (
-                self._standardize_strings(processed["chinese_proficiency"])
-                .str.replace("hsk", "", regex=False)
-                .replace("", np.nan)
-                .astype(float)
+            processed["chinese_proficiency"] = self._parse_chinese_proficiency(
+                processed["chinese_proficiency"]
             )
 
-        processed["language_requirement_passed"] = processed.apply(
-            self._language_requirement_passed, axis=1
-        )
-        processed["weighted_score"] = processed.apply(self._weighted_score, axis=1)
+        processed = processed.assign(**self._derive_features(processed))
 
-        drop_candidate = set(self._schema_config.get("dropped_columns", []))
-        protected = set(self._schema_config.get("target_columns", []))
-        protected.update({"program_category", "degree_language", "english_test_type"})
-        drop_list = [
-            col
-            for col in drop_candidate
-            if col in processed.columns and col not in protected
-        ]
+        drop_list = [col for col in processed.columns if col in self._droppable_columns]
 
         if drop_list:
             processed = drop_columns(processed, drop_list)
@@ -200,7 +297,8 @@ class DataTransformation:
                     "encoder",
                     OneHotEncoder(
                         handle_unknown="ignore",
-                        sparse_output=False,
+                        sparse_output=True,
+                        dtype=DataTransformation.ARRAY_DTYPE,
                     ),
                 ),
             ]
@@ -212,8 +310,66 @@ class DataTransformation:
                 ("categorical", categorical_pipeline, categorical_columns),
             ],
             remainder="drop",
+            # Always emit CSR so the one-hot block never materializes zeros.
+            sparse_threshold=1.0,
         )
 
+    @staticmethod
+    def _stack_features_targets(
+        features: np.ndarray, targets: pd.DataFrame
+    ) -> np.ndarray:
+        if sparse.issparse(features):
+            target_block = sparse.csr_matrix(
+                targets.to_numpy(dtype=features.dtype, copy=False)
+            )
+            return sparse.hstack([features, target_block], format="csr")
+
+        # Fill one preallocated buffer instead of np.concatenate's extra copy.
+        n_features = features.shape[1]
+        stacked = np.empty(
+            (features.shape[0], n_features + targets.shape[1]), dtype=features.dtype
+        )
+        stacked[:, :n_features] = features
+        stacked[:, n_features:] = targets.to_numpy(dtype=stacked.dtype, copy=False)
+        return stacked
+
+    def _fit_preprocessor(
+        self,
+        feature_train_df: pd.DataFrame,
+        numeric_columns: List[str],
+        categorical_columns: List[str],
+    ) -> Tuple[ColumnTransformer, np.ndarray]:
+        """Fit the preprocessor, reusing a cached fit for identical inputs.
+
+        With caching enabled the fit is keyed on a content hash of the
+        engineered training frame (values, columns, dtypes) and the selected
+        column lists.
+
+        Returns:
+            Tuple of the fitted ColumnTransformer and transformed train array.
+        """
+        cache_path = None
+        if self.data_transformation_config.cache_enabled:
+            key = dataframe_fingerprint(
+                feature_train_df, extra=(numeric_columns, categorical_columns)
+            )
+            cache_path = os.path.join(
+                self.data_transformation_config.cache_dir, f"{key}.pkl"
+            )
+            if os.path.exists(cache_path):
+                logging.info("Reusing cached preprocessor fit: %s", cache_path)
+                preprocessor, input_feature_train_arr = load_object(cache_path)
+                return preprocessor, input_feature_train_arr
+
+        preprocessor = self._build_preprocessor(numeric_columns, categorical_columns)
+        logging.info("Fitting preprocessing pipeline on training features")
+        input_feature_train_arr = preprocessor.fit_transform(feature_train_df)
+
+        if cache_path:
+            save_object(cache_path, (preprocessor, input_feature_train_arr))
+
+        return preprocessor, input_feature_train_arr
+
     def _encode_targets(
         self,
         train_targets: pd.DataFrame,
@@ -226,9 +382,21 @@ class DataTransformation:
         encoded_test = test_targets.copy()
 
         for column in target_columns:
+            # Single hash-based factorization; categories are sorted exactly as
+            # LabelEncoder would order them, so the codes are interchangeable.
+            train_codes = pd.Categorical(train_targets[column])
+            test_codes = pd.Categorical(
+                test_targets[column], categories=train_codes.categories
+            )
+            if (train_codes.codes < 0).any() or (test_codes.codes < 0).any():
+                raise ValueError(
+                    f"Target column '{column}' contains missing or unseen labels"
+                )
+
             encoder = LabelEncoder()
-            encoded_train[column] = encoder.fit_transform(train_targets[column])
-            encoded_test[column] = encoder.transform(test_targets[column])
+            encoder.classes_ = np.asarray(train_codes.categories, dtype=object)
+            encoded_train[column] = train_codes.codes
+            encoded_test[column] = test_codes.codes
             encoders[column] = encoder
 
         return encoded_train, encoded_test, encoders
@@ -265,66 +433,53 @@ class DataTransformation:
                 test_df, TARGET_COLUMNS
             )
 
-            feature_train_df = self._engineer_features(feature_train_df)
-            feature_test_df = self._engineer_features(feature_test_df)
+            # The splits are engineered independently and the vectorized
+            # pandas/Arrow kernels release the GIL, so both run side by side.
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                train_future = executor.submit(
+                    self._engineer_features, feature_train_df
+                )
+                test_future = executor.submit(self._engineer_features, feature_test_df)
+                feature_train_df = train_future.result()
+                feature_test_df = test_future.result()
 
-            numeric_cols = [
-                col
-                for col in self._schema_config.get("numerical_columns", [])
-                if col in feature_train_df.columns
-            ]
-            numeric_cols.extend(
-                [
-                    column
-                    for column in self._schema_config.get("engineered_columns", [])
-                    if column in feature_train_df.columns
-                ]
+            train_columns = set(feature_train_df.columns)
+            numeric_cols = sorted(
+                {col for col in self._numeric_schema if col in train_columns}
             )
-            numeric_cols = sorted(set(numeric_cols))
-
             categorical_cols = [
-                col
-                for col in self._schema_config.get("categorical_columns", [])
-                if col in feature_train_df.columns and col not in TARGET_COLUMNS
-            ]
-            categorical_cols = [
-                col
-                for col in categorical_cols
-                if col not in set(self._schema_config.get("dropped_columns", []))
+                col for col in self._categorical_schema if col in train_columns
             ]
 
-            preprocessor = self._build_preprocessor(numeric_cols, categorical_cols)
+            feature_train_df[numeric_cols] = feature_train_df[numeric_cols].astype(
+                self.ARRAY_DTYPE, copy=False
+            )
+            feature_test_df[numeric_cols] = feature_test_df[numeric_cols].astype(
+                self.ARRAY_DTYPE, copy=False
+            )
 
-            logging.info("Fitting preprocessing pipeline on training features")
-            input_feature_train_arr = preprocessor.fit_transform(feature_train_df)
+            preprocessor, input_feature_train_arr = self._fit_preprocessor(
+                feature_train_df, numeric_cols, categorical_cols
+            )
             input_feature_test_arr = preprocessor.transform(feature_test_df)
 
             encoded_train_targets, encoded_test_targets, encoders = (
                 self._encode_targets(target_train_df, target_test_df, TARGET_COLUMNS)
             )
 
-            train_arr = np.concatenate(
-                [input_feature_train_arr, encoded_train_targets.values], axis=1
+            train_arr = self._stack_features_targets(
+                input_feature_train_arr, encoded_train_targets
             )
-            test_arr = np.concatenate(
-                [input_feature_test_arr, encoded_test_targets.values], axis=1
+            test_arr = self._stack_features_targets(
+                input_feature_test_arr, encoded_test_targets
             )
 
-            transformed_feature_names = []
-            try:
-                transformed_feature_names = (
-                    preprocessor.get_feature_names_out().tolist()
-                )
-            except Exception:  # pragma: no cover - optional metadata
-                pass
-
-            preprocessor_bundle = {
-                "preprocessor": preprocessor,
-                "target_encoders": encoders,
-                "numeric_columns": numeric_cols,
-                "categorical_columns": categorical_cols,
-                "transformed_feature_names": transformed_feature_names,
-            }
+            preprocessor_bundle = PreprocessorBundle(
+                preprocessor=preprocessor,
+                target_encoders=encoders,
+                numeric_columns=numeric_cols,
+                categorical_columns=categorical_cols,
+            )
 
             save_object(
                 file_path=self.data_transformation_config.transformed_object_file_path,
@@ -9,29 +9,54 @@ Raises:
     BitAdmitAIException: On IO, schema load, or validation/drift computation failure.
 """
 
+import datetime
 import json
+import os
 import sys
 import warnings
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Union
 
-warnings.filterwarnings(
-    "ignore", category=UserWarning, module="evidently"
-)  # version upgrade warrning contains breaking changes
-
+with warnings.catch_warnings():
+    # Evidently 0.2 flags its Profile API as deprecated on import.
+    warnings.simplefilter("ignore", category=UserWarning)
+    from evidently.model_profile import Profile
+    from evidently.model_profile.sections import DataDriftProfileSection
 
+import numpy as np
 import pandas as pd
-from evidently.model_profile import Profile
-from evidently.model_profile.sections import DataDriftProfileSection
-
 from pandas import DataFrame
 
 from BIT_ADMIT_AI.exceptions import BitAdmitAIException
 from BIT_ADMIT_AI.logger import logging
-from BIT_ADMIT_AI.utils.main_utils import read_yaml_file, write_yaml_file
+from BIT_ADMIT_AI.utils.main_utils import (
+    dataframe_fingerprint,
+    downcast_dtypes,
+    read_column_names,
+    read_dataframe,
+    read_json_file,
+    read_yaml_file,
+    save_dataframe,
+    write_json_file,
+    write_yaml_file,
+)
 from BIT_ADMIT_AI.entity.artifact import DataValidationArtifact, DAArtifacts
 from BIT_ADMIT_AI.entity.config import DataValidationConfig
 from BIT_ADMIT_AI.constant import SCHEMA_PATH
 
 
+def _drift_profile(reference_df: DataFrame, current_df: DataFrame) -> dict:
+    """Compute an Evidently drift profile as plain Python types.
+
+    Module-level so it can run in a worker process for column shards.
+    """
+    profile = Profile(sections=[DataDriftProfileSection()])
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=UserWarning)
+        profile.calculate(reference_df, current_df)
+    return DataValidation._to_builtin(profile.object())
+
+
 class DataValidation:
     """Validate dataset against schema and detect drift.
 
@@ -43,6 +68,7 @@ class DataValidation:
         data_ingestion_artifact: Stored ingestion artifact.
         data_validation_config: Stored validation config.
         _schema_config: Parsed schema.yaml content.
+        _required_cols: Numerical and categorical schema columns as a frozenset.
     """
 
     def __init__(
@@ -58,17 +84,25 @@ class DataValidation:
         try:
             self.data_ingestion_artifact = data_ingestion_artifact
             self.data_validation_config = data_validation_config
-            self._schema_config = read_yaml_file(file_path=SCHEMA_PATH)
+            # read_yaml_file reuses the parsed schema until the file changes.
+            schema_config = read_yaml_file(file_path=SCHEMA_PATH)
+            self._schema_config = schema_config
+            # Derived once; the validators only do C-level len/set checks.
+            self._n_expected_cols = len(schema_config["columns"])
+            self._num_cols = frozenset(schema_config["numerical_columns"])
+            self._cat_cols = frozenset(schema_config["categorical_columns"])
+            self._required_cols = self._num_cols | self._cat_cols
         except Exception as e:
-            logging.error(f"failing to start the data validation, {e}")
+            logging.error("failing to start the data validation, %s", e)
             raise BitAdmitAIException(e, sys)
 
     @staticmethod
-    def read_data(file_path: str) -> DataFrame:
-        """Read CSV data.
+    def read_data(file_path: str, columns: Optional[List[str]] = None) -> DataFrame:
+        """Read a train/test split.
 
         Args:
-            file_path: Path to CSV file.
+            file_path: Path to the CSV, Parquet or Feather file.
+            columns: Optional subset of columns to load.
 
         Returns:
             pandas.DataFrame: Loaded data.
@@ -77,16 +111,76 @@ class DataValidation:
             BitAdmitAIException: If read fails.
         """
         try:
-            return pd.read_csv(file_path)
+            return read_dataframe(file_path, columns=columns)
         except Exception as e:
-            logging.error(f"Failed to read data from {file_path}: {e}")
+            logging.error("Failed to read data from %s: %s", file_path, e)
             raise BitAdmitAIException(e, sys) from e
 
-    def validate_num_of_col(self, dataframe: DataFrame) -> bool:
+    def read_reference_data(
+        self, file_path: str, columns: Optional[List[str]] = None
+    ) -> DataFrame:
+        """Read the drift reference split through a Parquet sidecar.
+
+        With caching enabled, a CSV reference is materialized once as
+        ``<name>.parquet`` next to it and later runs read the sidecar instead
+        of re-tokenizing the CSV. The sidecar is rebuilt whenever the CSV is
+        newer.
+
+        Args:
+            file_path: Path to the reference (training) split.
+            columns: Optional subset of columns to load.
+
+        Returns:
+            pandas.DataFrame: Loaded reference data.
+
+        Raises:
+            BitAdmitAIException: If read or sidecar write fails.
+        """
+        root, suffix = os.path.splitext(file_path)
+        if not self.data_validation_config.cache_enabled or suffix.lower() != ".csv":
+            return DataValidation.read_data(file_path=file_path, columns=columns)
+
+        try:
+            parquet_path = root + ".parquet"
+            if (
+                os.path.exists(parquet_path)
+                and os.stat(parquet_path).st_mtime >= os.stat(file_path).st_mtime
+            ):
+                return read_dataframe(parquet_path, columns=columns)
+
+            # Persist the full frame so later runs can select any columns.
+            reference_df = read_dataframe(file_path)
+            save_dataframe(parquet_path, reference_df, make_dirs=False)
+            logging.info("Wrote Parquet reference data to %s", parquet_path)
+            return reference_df if columns is None else reference_df[columns]
+        except Exception as e:
+            logging.error("Failed to read reference data from %s: %s", file_path, e)
+            raise BitAdmitAIException(e, sys) from e
+
+    @staticmethod
+    def read_columns(file_path: str) -> List[str]:
+        """Read only the header of a train/test split.
+
+        Args:
+            file_path: Path to the CSV, Parquet or Feather file.
+
+        Returns:
+            List[str]: Column names.
+
+        Raises:
+            BitAdmitAIException: If read fails.
+        """
+        try:
+            return read_column_names(file_path)
+        except Exception as e:
+            logging.error("Failed to read columns from %s: %s", file_path, e)
+            raise BitAdmitAIException(e, sys) from e
+
+    def validate_num_of_col(self, dataframe: Union[DataFrame, List[str]]) -> bool:
         """Check column count equals schema-defined count.
 
         Args:
-            dataframe: DataFrame to validate.
+            dataframe: DataFrame to validate, or just its column names.
 
         Returns:
             bool: True if counts match.
@@ -95,18 +189,19 @@ class DataValidation:
             BitAdmitAIException: On validation error.
         """
         try:
-            status = len(dataframe.columns) == len(self._schema_config["columns"])
-            logging.info(f"Is required column present: [{status}]")
+            columns = getattr(dataframe, "columns", dataframe)
+            status = len(columns) == self._n_expected_cols
+            logging.info("Is required column present: [%s]", status)
             return status
         except Exception as e:
-            logging.error(f"Failing to validate the num of columns, {e}")
+            logging.error("Failing to validate the num of columns, %s", e)
             raise BitAdmitAIException(e, sys)
 
-    def is_column_exist(self, df: DataFrame) -> bool:
+    def is_column_exist(self, df: Union[DataFrame, List[str]]) -> bool:
         """Ensure all required numerical and categorical columns are present.
 
         Args:
-            df: DataFrame to check.
+            df: DataFrame to check, or just its column names.
 
         Returns:
             bool: True if all required columns exist; False otherwise.
@@ -115,32 +210,129 @@ class DataValidation:
             BitAdmitAIException: On validation error.
         """
         try:
-            dataframe_columns = df.columns
-            missing_num_columns = []
-            missing_cat_columns = []
-            for column in self._schema_config["numerical_columns"]:
-                if column not in dataframe_columns:
-                    missing_num_columns.append(column)
-
-            if len(missing_num_columns) > 0:
-                logging.info(f"Missing numerical column: {missing_num_columns}")
-
-            for column in self._schema_config["categorical_columns"]:
-                if column not in dataframe_columns:
-                    missing_cat_columns.append(column)
-
-            if len(missing_cat_columns) > 0:
-                logging.info(f"Missing categorical column: {missing_cat_columns}")
-
-            return (
-                False
-                if len(missing_cat_columns) > 0 or len(missing_num_columns) > 0
-                else True
-            )
+            dataframe_columns = getattr(df, "columns", df)
+            if self._required_cols.issubset(dataframe_columns):
+                return True
+
+            # Only the failure path needs the (schema-ordered) missing names.
+            present = set(dataframe_columns)
+            missing_num_columns = [
+                column
+                for column in self._schema_config["numerical_columns"]
+                if column not in present
+            ]
+            if missing_num_columns:
+                logging.info("Missing numerical column: %s", missing_num_columns)
+
+            missing_cat_columns = [
+                column
+                for column in self._schema_config["categorical_columns"]
+                if column not in present
+            ]
+            if missing_cat_columns:
+                logging.info("Missing categorical column: %s", missing_cat_columns)
+
+            return False
         except Exception as e:
-            logging.error(f"failed to check the col existing {e}")
+            logging.error("failed to check the col existing %s", e)
             raise BitAdmitAIException(e, sys) from e
 
+    def _downcast_numeric(self, df: DataFrame) -> DataFrame:
+        """Downcast the schema numerical columns for profiling.
+
+        The drift statistics do not need double precision or 64-bit counts,
+        and narrower columns cut the memory traffic through Evidently's
+        reductions. The columns stay numeric, so their feature type is
+        unchanged; categorical columns keep their dtype for the same reason.
+        """
+        return downcast_dtypes(df, columns=self._schema_config["numerical_columns"])
+
+    @staticmethod
+    def _as_numpy_backed(df: DataFrame) -> DataFrame:
+        """Cast Arrow-backed string columns to object; Evidently 0.2 rejects them."""
+        string_columns = df.select_dtypes(include="string").columns
+        if len(string_columns) == 0:
+            return df
+        return df.astype({column: object for column in string_columns})
+
+    @staticmethod
+    def _to_builtin(obj):
+        """Convert a profile result to plain Python types in a single walk.
+
+        Mirrors Evidently's NumpyEncoder (and JSON's key coercion), so the
+        report matches the former ``json.loads(profile.json())`` output
+        without serializing to a string and parsing it back.
+        """
+        if isinstance(obj, dict):
+            return {
+                key if isinstance(key, str) else json.dumps(key): (
+                    DataValidation._to_builtin(value)
+                )
+                for key, value in obj.items()
+            }
+        if isinstance(obj, (list, tuple)):
+            return [DataValidation._to_builtin(value) for value in obj]
+        if isinstance(obj, np.ndarray):
+            return DataValidation._to_builtin(obj.tolist())
+        if isinstance(obj, (np.void, type(pd.NaT))):
+            return None
+        if isinstance(obj, np.generic):
+            return obj.item()
+        if isinstance(obj, pd.Timedelta):
+            return str(obj)
+        if isinstance(obj, (datetime.datetime, datetime.date)):
+            return obj.isoformat()
+        return obj
+
+    def _column_shards(self, columns: List[str]) -> List[List[str]]:
+        """Split columns into round-robin shards for parallel profiling."""
+        n_shards = min(
+            self.data_validation_config.drift_max_workers,
+            len(columns) // max(self.data_validation_config.drift_shard_min_columns, 1),
+        )
+        if n_shards <= 1:
+            return [columns]
+        return [columns[shard::n_shards] for shard in range(n_shards)]
+
+    @staticmethod
+    def _merge_drift_reports(reports: List[dict]) -> dict:
+        """Combine per-shard drift reports into one dataset-level report.
+
+        Feature lists and per-column results are concatenated; dataset drift
+        is recomputed from the summed counts with Evidently's rule
+        (share of drifted features >= drift_share).
+        """
+        merged = reports[0]
+        data = merged["data_drift"]["data"]
+        metrics = data["metrics"]
+        for report in reports[1:]:
+            shard_data = report["data_drift"]["data"]
+            for key in (
+                "num_feature_names",
+                "cat_feature_names",
+                "text_feature_names",
+                "datetime_feature_names",
+            ):
+                if shard_data.get(key):
+                    data[key] = (data.get(key) or []) + shard_data[key]
+            shard_metrics = shard_data["metrics"]
+            metrics["n_features"] += shard_metrics["n_features"]
+            metrics["n_drifted_features"] += shard_metrics["n_drifted_features"]
+            metrics.update(
+                (column, result)
+                for column, result in shard_metrics.items()
+                if isinstance(result, dict)
+            )
+
+        share = (
+            metrics["n_drifted_features"] / metrics["n_features"]
+            if metrics["n_features"]
+            else 0.0
+        )
+        metrics["share_drifted_features"] = share
+        metrics["dataset_drift"] = bool(share >= data["options"]["drift_share"])
+        return merged
+
     def detect_dataset_drift(
         self,
         reference_df: DataFrame,
@@ -159,25 +351,51 @@ class DataValidation:
             BitAdmitAIException: If profiling or write fails.
         """
         try:
-            data_drift_profile = Profile(sections=[DataDriftProfileSection()])
-
-            data_drift_profile.calculate(reference_df, current_df)
-
-            report = data_drift_profile.json()
-            json_report = json.loads(report)
+            reference_df = self._downcast_numeric(self._as_numpy_backed(reference_df))
+            current_df = self._downcast_numeric(self._as_numpy_backed(current_df))
+
+            cache_path = None
+            if self.data_validation_config.cache_enabled:
+                # Re-runs on the same reference/current data reuse the report.
+                key = dataframe_fingerprint(reference_df, current_df)
+                cache_path = os.path.join(
+                    self.data_validation_config.cache_dir, f"{key}.json"
+                )
+
+            shards = self._column_shards(list(reference_df.columns))
+            if cache_path and os.path.exists(cache_path):
+                logging.info("Reusing cached drift report: %s", cache_path)
+                json_report = read_json_file(cache_path)
+            elif len(shards) == 1:
+                json_report = _drift_profile(reference_df, current_df)
+            else:
+                # Per-column drift tests are independent; profile each column
+                # shard in its own process and merge the results.
+                logging.info("Profiling drift in %s column shards", len(shards))
+                with ProcessPoolExecutor(max_workers=len(shards)) as executor:
+                    reports = list(
+                        executor.map(
+                            _drift_profile,
+                            [reference_df[columns] for columns in shards],
+                            [current_df[columns] for columns in shards],
+                        )
+                    )
+                json_report = self._merge_drift_reports(reports)
+
+            if cache_path and not os.path.exists(cache_path):
+                write_json_file(cache_path, json_report)
 
             write_yaml_file(
                 file_path=self.data_validation_config.drift_report_file_path,
                 content=json_report,
             )
 
-            n_features = json_report["data_drift"]["data"]["metrics"]["n_features"]
-            n_drifted_features = json_report["data_drift"]["data"]["metrics"][
-                "n_drifted_features"
-            ]
+            metrics = json_report["data_drift"]["data"]["metrics"]
+            n_features = metrics["n_features"]
+            n_drifted_features = metrics["n_drifted_features"]
 
-            logging.info(f"{n_drifted_features}/{n_features} drift detected.")
-            drift_status = json_report["data_drift"]["data"]["metrics"]["dataset_drift"]
+            logging.info("%s/%s drift detected.", n_drifted_features, n_features)
+            drift_status = metrics["dataset_drift"]
             return drift_status
         except Exception as e:
             raise BitAdmitAIException(e, sys) from e
@@ -192,41 +410,62 @@ class DataValidation:
             BitAdmitAIException: On any step failure.
         """
         try:
-            validation_error_msg = ""
             logging.info("Starting data validation")
-            train_df, test_df = (
-                DataValidation.read_data(
-                    file_path=self.data_ingestion_artifact.training_file_path
-                ),
-                DataValidation.read_data(
-                    file_path=self.data_ingestion_artifact.test_file_path
-                ),
+            # Schema checks only need the headers; read them without rows.
+            train_columns = self.read_columns(
+                self.data_ingestion_artifact.training_file_path
             )
-
-            status = self.validate_num_of_col(dataframe=train_df)
-            logging.info(
-                f"All required columns present in training dataframe: {status}"
+            test_columns = self.read_columns(
+                self.data_ingestion_artifact.test_file_path
             )
-            if not status:
-                validation_error_msg += "Columns are missing in training dataframe."
-            status = self.validate_num_of_col(dataframe=test_df)
-
-            logging.info(f"All required columns present in testing dataframe: {status}")
-            if not status:
-                validation_error_msg += "Columns are missing in test dataframe."
-
-            status = self.is_column_exist(df=train_df)
-
-            if not status:
-                validation_error_msg += "Columns are missing in training dataframe."
-            status = self.is_column_exist(df=test_df)
-
-            if not status:
-                validation_error_msg += "columns are missing in test dataframe."
 
-            validation_status = len(validation_error_msg) == 0
+            validation_errors: List[str] = []
+            for split_name, columns in (
+                ("training", train_columns),
+                ("test", test_columns),
+            ):
+                status = self.validate_num_of_col(dataframe=columns)
+                logging.info(
+                    "Column count matches schema in %s: %s", split_name, status
+                )
+                if not status:
+                    validation_errors.append(
+                        f"Column count mismatch in {split_name} dataframe."
+                    )
+
+                status = self.is_column_exist(df=columns)
+                logging.info(
+                    "All required columns present in %s dataframe: %s",
+                    split_name,
+                    status,
+                )
+                if not status:
+                    validation_errors.append(
+                        f"Required columns missing in {split_name} dataframe."
+                    )
+
+            validation_error_msg = "\n".join(validation_errors)
+            # Drift detection is the expensive step; it only runs on a clean
+            # schema.
+            validation_status = not validation_errors
 
             if validation_status:
+                # Full reads are only needed for drift, after the schema passed,
+                # and only for the schema's feature columns.
+                drift_columns = (
+                    self._schema_config["numerical_columns"]
+                    + self._schema_config["categorical_columns"]
+                )
+                train_df, test_df = (
+                    self.read_reference_data(
+                        file_path=self.data_ingestion_artifact.training_file_path,
+                        columns=drift_columns,
+                    ),
+                    DataValidation.read_data(
+                        file_path=self.data_ingestion_artifact.test_file_path,
+                        columns=drift_columns,
+                    ),
+                )
                 drift_status = self.detect_dataset_drift(train_df, test_df)
                 if drift_status:
                     logging.info("Drift detected.")
@@ -234,7 +473,7 @@ class DataValidation:
                 else:
                     validation_error_msg = "Drift not detected"
             else:
-                logging.info(f"Validation_error: {validation_error_msg}")
+                logging.info("Validation_error: %s", validation_error_msg)
 
             data_validation_artifact = DataValidationArtifact(
                 validation_status=validation_status,
@@ -242,7 +481,7 @@ class DataValidation:
                 drift_report_file_path=self.data_validation_config.drift_report_file_path,
             )
 
-            logging.info(f"Data validation artifact: {data_validation_artifact}")
+            logging.info("Data validation artifact: %s", data_validation_artifact)
             return data_validation_artifact
         except Exception as e:
             raise BitAdmitAIException(e, sys) from e
@@ -9,8 +9,7 @@ import sys
 from pathlib import Path
 from typing import Dict, Optional
 
-import numpy as np
-
+from BIT_ADMIT_AI.components.model_pusher import ModelPusher
 from BIT_ADMIT_AI.entity.artifact import (
     ModelEvaluationArtifact,
     ModelTrainerArtifact,
@@ -21,7 +20,7 @@ from BIT_ADMIT_AI.entity.config import (
 )
 from BIT_ADMIT_AI.exceptions import BitAdmitAIException
 from BIT_ADMIT_AI.logger import logging
-from BIT_ADMIT_AI.utils.main_utils import read_yaml_file
+from BIT_ADMIT_AI.utils.main_utils import read_json_file, read_yaml_file
 
 
 class ModelEvaluation:
@@ -51,14 +50,20 @@ class ModelEvaluation:
     @staticmethod
     def _average_f1(metrics: Dict[str, Dict[str, float]]) -> float:
         scores = [target.get("f1_score", 0.0) for target in metrics.values()]
-        return float(np.mean(scores)) if scores else 0.0
+        # A handful of floats: plain sum/len beats building an ndarray.
+        return float(sum(scores) / len(scores)) if scores else 0.0
 
     def _load_best_metrics(self) -> Optional[Dict[str, float]]:
         try:
             metrics_path = Path(self.model_evaluation_config.best_model_metrics_path)
-            if metrics_path.is_file():
-                return read_yaml_file(str(metrics_path))
-            return None
+            if not metrics_path.is_file():
+                # Best models promoted before the JSON switch kept YAML metrics.
+                metrics_path = metrics_path.with_suffix(".yaml")
+            if not metrics_path.is_file():
+                return None
+            if metrics_path.suffix == ".json":
+                return read_json_file(str(metrics_path))
+            return read_yaml_file(str(metrics_path))
         except Exception as exc:
             raise BitAdmitAIException(exc, sys) from exc
 
@@ -113,8 +118,6 @@ class ModelEvaluation:
                 )
 
             if is_model_accepted:
-                from BIT_ADMIT_AI.components.model_pusher import ModelPusher
-
                 pusher = ModelPusher(
                     model_trainer_artifact=self.model_trainer_artifact,
                     model_pusher_config=self.model_pusher_config,
@@ -1,14 +1,16 @@
 """Model pusher component.
 
 Promotes an accepted trained model to "best model" by:
-- copying the trained artifact to the best model location,
-- writing accompanying metrics (avg F1 and per-target) as YAML.
+- hard-linking (or reflink/copying) the trained artifact to the best model
+  location,
+- atomically writing accompanying metrics (avg F1 and per-target) as JSON.
 
 Used by ModelEvaluation after acceptance.
 """
 
 import os
 import shutil
+import subprocess
 import sys
 from pathlib import Path
 from typing import Dict
@@ -17,7 +19,7 @@ from BIT_ADMIT_AI.entity.artifact import ModelPusherArtifact, ModelTrainerArtifa
 from BIT_ADMIT_AI.entity.config import ModelPusherConfig
 from BIT_ADMIT_AI.exceptions import BitAdmitAIException
 from BIT_ADMIT_AI.logger import logging
-from BIT_ADMIT_AI.utils.main_utils import write_yaml_file
+from BIT_ADMIT_AI.utils.main_utils import wait_for_pending_save, write_json_file
 
 
 class ModelPusher:
@@ -36,12 +38,50 @@ class ModelPusher:
         self.model_trainer_artifact = model_trainer_artifact
         self.model_pusher_config = model_pusher_config
 
+    @staticmethod
+    def _reflink_copy(source_path: Path, destination_path: Path) -> bool:
+        """Copy via ``cp --reflink=auto`` on Linux; False if unavailable."""
+        if not sys.platform.startswith("linux"):
+            return False
+        try:
+            completed = subprocess.run(
+                [
+                    "cp",
+                    "--reflink=auto",
+                    "--preserve=timestamps",
+                    str(source_path),
+                    str(destination_path),
+                ],
+                capture_output=True,
+            )
+        except OSError:
+            return False
+        return completed.returncode == 0
+
+    @staticmethod
+    def _promote_file(source_path: Path, destination_path: Path) -> None:
+        """Place ``source_path`` at ``destination_path`` without copying bytes.
+
+        Trained artifacts are never modified after training, so a hard link is
+        safe. Falls back to a reflink-capable ``cp`` on Linux (copy-on-write
+        filesystems clone instantly) and finally to ``shutil.copy2``. The file
+        is staged next to the destination and renamed over it atomically.
+        """
+        staging_path = destination_path.with_name(f".{destination_path.name}.tmp")
+        staging_path.unlink(missing_ok=True)
+        try:
+            os.link(source_path, staging_path)
+        except OSError:
+            if not ModelPusher._reflink_copy(source_path, staging_path):
+                shutil.copy2(source_path, staging_path)
+        os.replace(staging_path, destination_path)
+
     def push_model(
         self,
         metrics_per_target: Dict[str, Dict[str, float]],
         avg_f1_score: float,
     ) -> ModelPusherArtifact:
-        """Copy the candidate model to best path and persist metrics YAML.
+        """Promote the candidate model to best path and persist metrics JSON.
 
         Args:
             metrics_per_target: Dict[target -> {metric_name: value}] from training.
@@ -58,16 +98,17 @@ class ModelPusher:
 
             source_path = Path(self.model_trainer_artifact.trained_model_file_path)
             destination_path = Path(self.model_pusher_config.best_model_path)
-            shutil.copy2(source_path, destination_path)
+            # The trainer persists its package in the background.
+            wait_for_pending_save(str(source_path))
+            self._promote_file(source_path, destination_path)
 
             metadata = {
                 "avg_f1_score": avg_f1_score,
                 "metrics_per_target": metrics_per_target,
             }
-            write_yaml_file(
+            write_json_file(
                 file_path=self.model_pusher_config.best_model_metrics_path,
                 content=metadata,
-                replace=True,
             )
 
             logging.info(
@@ -17,31 +17,113 @@ Raises:
 """
 
 import importlib
+import json
+import math
+import os
 import sys
-from typing import Dict
+import warnings
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Optional
 
 import numpy as np
+from joblib import Parallel, delayed
+from scipy import sparse
 from sklearn.base import clone
-from sklearn.metrics import f1_score, precision_score, recall_score
-from sklearn.model_selection import ParameterGrid, StratifiedKFold, cross_val_score
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.metrics import check_scoring, precision_recall_fscore_support
+from sklearn.model_selection import (
+    HalvingGridSearchCV,
+    ParameterGrid,
+    ParameterSampler,
+    StratifiedKFold,
+)
 
-from BIT_ADMIT_AI.constant import TARGET_COLUMNS
+from BIT_ADMIT_AI.constant import RANDOM_STATE, TARGET_COLUMNS
 from BIT_ADMIT_AI.entity.artifact import (
     DataTransformationArtifact,
     ModelTrainerArtifact,
 )
 from BIT_ADMIT_AI.entity.config import ModelTrainerConfig
-from BIT_ADMIT_AI.entity.estimator import TargetValueMap
+from BIT_ADMIT_AI.entity.estimator import PreprocessorBundle, TargetValueMap
 from BIT_ADMIT_AI.exceptions import BitAdmitAIException
 from BIT_ADMIT_AI.logger import logging
 from BIT_ADMIT_AI.utils.main_utils import (
     load_numpy_array_data,
     load_object,
     read_yaml_file,
-    save_object,
+    save_object_async,
 )
 
 
+def _fit_score_fold(
+    estimator_cls, base_params, param_set, X, y, train_idx, test_idx, scoring
+):
+    """Fit one CV fold of ``estimator_cls(**base_params, **param_set)``.
+
+    Module-level so joblib can ship it to worker processes. The estimator is
+    built straight from its class and flat params instead of ``clone`` +
+    ``set_params``. A failed fit scores NaN, matching ``cross_val_score``'s
+    default ``error_score``.
+    """
+    fold_estimator = estimator_cls(**{**base_params, **param_set})
+    try:
+        fold_estimator.fit(X[train_idx], y[train_idx])
+    except Exception as exc:
+        logging.warning("Fit failed for params %s: %s", param_set, exc)
+        return float("nan")
+    scorer = check_scoring(fold_estimator, scoring=scoring)
+    return float(scorer(fold_estimator, X[test_idx], y[test_idx]))
+
+
+def _score_params(estimator, param_set, X, y, cv_folds, scoring) -> float:
+    """Mean score of ``estimator`` under ``param_set`` over ``cv_folds``."""
+    estimator_cls = type(estimator)
+    base_params = estimator.get_params(deep=False)
+    return float(
+        np.mean(
+            [
+                _fit_score_fold(
+                    estimator_cls,
+                    base_params,
+                    param_set,
+                    X,
+                    y,
+                    train_idx,
+                    test_idx,
+                    scoring,
+                )
+                for train_idx, test_idx in cv_folds
+            ]
+        )
+    )
+
+
+@lru_cache(maxsize=1)
+def _xgboost_cuda_available() -> bool:
+    """Probe once whether XGBoost can actually train on a CUDA device.
+
+    CUDA-enabled wheels silently fall back to CPU when no GPU is visible, so
+    a one-round fit is inspected for the device it really used.
+    """
+    try:
+        xgboost = importlib.import_module("xgboost")
+        if not xgboost.build_info().get("USE_CUDA"):
+            return False
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            booster = xgboost.train(
+                {"device": "cuda", "tree_method": "hist"},
+                xgboost.DMatrix(np.zeros((2, 1)), label=[0, 1]),
+                num_boost_round=1,
+            )
+        config = json.loads(booster.save_config())
+        return config["learner"]["generic_param"]["device"].startswith("cuda")
+    except Exception as exc:
+        logging.debug("CUDA probe for XGBoost failed: %s", exc)
+        return False
+
+
 class ModelTrainer:
     """Train per-target classifiers and persist the inference bundle.
 
@@ -76,11 +158,15 @@ class ModelTrainer:
 
     def _load_transformed_datasets(self):
         try:
+            # Read-only maps are enough: features and targets are copied out
+            # (see _split_features_targets), never modified in place.
             train_arr = load_numpy_array_data(
-                self.data_transformation_artifact.transformed_train_file_path
+                self.data_transformation_artifact.transformed_train_file_path,
+                mmap_mode="r",
             )
             test_arr = load_numpy_array_data(
-                self.data_transformation_artifact.transformed_test_file_path
+                self.data_transformation_artifact.transformed_test_file_path,
+                mmap_mode="r",
             )
             preprocessor_bundle = load_object(
                 self.data_transformation_artifact.transformed_object_file_path
@@ -91,108 +177,238 @@ class ModelTrainer:
 
     @staticmethod
     def _split_features_targets(dataset, feature_count):
-        features = dataset[:, :feature_count]
+        # Transformed arrays are stored as CSR; densify at the model boundary
+        # since XGBoost treats implicit zeros in sparse input as missing.
+        if sparse.issparse(dataset):
+            dataset = dataset.toarray()
+        # Tree learners work in float32 anyway (sklearn's DTYPE, XGBoost's
+        # histogram input); hand them a contiguous float32 block once rather
+        # than letting every fold re-convert a strided float64 view.
+        features = np.ascontiguousarray(dataset[:, :feature_count], dtype=np.float32)
         targets = dataset[:, feature_count:]
         return features, targets
 
     @staticmethod
-    def _instantiate_estimator(model_info: Dict, num_classes: int):
+    def _instantiate_estimator(
+        model_info: Dict,
+        num_classes: int,
+        use_gpu: bool = False,
+        estimator_n_jobs: Optional[int] = None,
+    ):
         module = importlib.import_module(model_info["module"])
         estimator_cls = getattr(module, model_info["class"])
         params = model_info.get("params", {}).copy()
         params.pop("use_label_encoder", None)  # Dropin deprecated XGBoost flag
 
+        if model_info["module"].startswith("xgboost"):
+            # Histogram method: features are pre-binned (QuantileDMatrix under
+            # the sklearn API) into at most max_bin buckets.
+            params.setdefault("tree_method", "hist")
+            params.setdefault("max_bin", 256)
+            if use_gpu and _xgboost_cuda_available():
+                params.setdefault("device", "cuda")
+
         if model_info["module"].startswith("xgboost") and num_classes > 2:
             params.setdefault("objective", "multi:softprob")
             params.setdefault("num_class", num_classes)
             params.setdefault("eval_metric", "mlogloss")
 
-        return estimator_cls(**params)
+        estimator = estimator_cls(**params)
+        # Multi-core estimators (XGBoost, forests, KNN, ...) take the cores the
+        # search leaves idle, unless the config pins n_jobs itself.
+        if (
+            estimator_n_jobs is not None
+            and "n_jobs" not in params
+            and "n_jobs" in estimator.get_params(deep=False)
+        ):
+            estimator.set_params(n_jobs=estimator_n_jobs)
+        # Seed stochastic estimators (e.g. GradientBoosting) unless the config
+        # does; left unset they draw from NumPy's global RandomState.
+        if (
+            "random_state" not in params
+            and "random_state" in estimator.get_params(deep=False)
+            and estimator.get_params(deep=False)["random_state"] is None
+        ):
+            estimator.set_params(random_state=RANDOM_STATE)
+        return estimator
+
+    def _search_n_jobs(self, n_jobs_inner=None):
+        """Effective grid-search ``n_jobs`` within this target's core share."""
+        grid_params = self.model_config.get("grid_search", {}).get("params", {})
+        n_jobs = grid_params.get("n_jobs")
+        if n_jobs_inner is not None:
+            # Trainer runs several targets at once; cap at our share of cores.
+            n_jobs = (
+                n_jobs_inner
+                if n_jobs is not None and n_jobs < 0
+                else min(n_jobs or 1, n_jobs_inner)
+            )
+        return n_jobs
 
-    def _run_grid_search(self, estimator, search_params, X, y):
+    def _run_grid_search(self, estimator, search_params, X, y, n_jobs_inner=None):
         grid_cfg = self.model_config.get("grid_search", {})
         if not grid_cfg or not search_params:
             estimator.fit(X, y)
-            return estimator, {}
+            return estimator, {}, None
 
         grid_kwargs = grid_cfg.get("params", {}).copy()
         grid_kwargs.pop("verbose", None)
 
         cv_splits = int(grid_kwargs.pop("cv", 3))
-        n_jobs = grid_kwargs.pop("n_jobs", None)
+        grid_kwargs.pop("n_jobs", None)
+        n_jobs = self._search_n_jobs(n_jobs_inner)
         scoring = grid_kwargs.pop("scoring", None)
         shuffle = grid_kwargs.pop("shuffle", True)
         random_state = grid_kwargs.pop("random_state", 42)
+        search_strategy = str(grid_kwargs.pop("search_strategy", "grid")).lower()
+        n_iter = int(grid_kwargs.pop("n_iter", 10))
+        halving_factor = grid_kwargs.pop("factor", 3)
         snapshot_interval = float(grid_kwargs.pop("snapshot_interval", 0.25))
         snapshot_interval = min(max(snapshot_interval, 0.05), 1.0)
 
         if grid_kwargs:
             logging.debug("Unused grid params ignored: %s", grid_kwargs)
 
-        param_grid = list(ParameterGrid(search_params))
-        total_combos = len(param_grid)
-        if total_combos == 0:
+        full_grid = ParameterGrid(search_params)
+        if len(full_grid) == 0:
             estimator.fit(X, y)
-            return estimator, {}
+            return estimator, {}, None
 
         cv_strategy = StratifiedKFold(
             n_splits=cv_splits,
             shuffle=shuffle,
             random_state=random_state if shuffle else None,
         )
+        # Materialize the folds once; every combo reuses the same indices.
+        cv_folds = list(cv_strategy.split(X, y))
 
-        snapshot_steps = [
-            round(step, 2)
-            for step in np.arange(
-                snapshot_interval, 1.0 + snapshot_interval, snapshot_interval
+        if search_strategy == "bayes":
+            best_params, best_score = self._run_bayes_search(
+                estimator,
+                search_params,
+                X,
+                y,
+                cv_folds,
+                scoring,
+                n_trials=n_iter,
+                random_state=random_state,
+            )
+            logging.info(
+                "Bayesian search completed. Best CV score: %.4f with params: %s",
+                best_score,
+                best_params,
+            )
+            best_estimator = clone(estimator).set_params(**best_params)
+            best_estimator.fit(X, y)
+            return best_estimator, best_params, best_score
+
+        if search_strategy == "halving":
+            # Successive halving: every combo starts on a small sample and only
+            # the best 1/factor advance to the next, larger budget.
+            search = HalvingGridSearchCV(
+                estimator,
+                search_params,
+                factor=halving_factor,
+                resource="n_samples",
+                cv=cv_strategy,
+                scoring=scoring,
+                n_jobs=n_jobs,
+                random_state=random_state,
+                refit=True,
+            )
+            search.fit(X, y)
+            logging.info(
+                "Halving search completed over %d iterations. Best CV score: %.4f "
+                "with params: %s",
+                search.n_iterations_,
+                search.best_score_,
+                search.best_params_,
+            )
+            return search.best_estimator_, search.best_params_, search.best_score_
+
+        if search_strategy == "random":
+            # A fixed budget of sampled combos instead of the full product.
+            param_grid = list(
+                ParameterSampler(
+                    search_params,
+                    n_iter=min(n_iter, len(full_grid)),
+                    random_state=random_state,
+                )
             )
-            if step <= 1.0 + 1e-6
-        ]
-        snapshot_index = 0
+        elif search_strategy == "grid":
+            param_grid = list(full_grid)
+        else:
+            raise BitAdmitAIException(
+                f"Unknown search_strategy '{search_strategy}'", sys
+            )
+        total_combos = len(param_grid)
+
+        # Combo indices at which each snapshot_interval of progress is reached.
+        n_snapshots = int(1.0 / snapshot_interval + 1e-6)
+        snapshot_combos = frozenset(
+            max(1, math.ceil(total_combos * step * snapshot_interval - 1e-9))
+            for step in range(1, n_snapshots + 1)
+        )
 
         best_score = -np.inf
-        best_params: Dict = {}
-        best_estimator = None
+        best_params = None
+        combo_scores = []
 
         logging.info(
-            "Grid search over %d combinations (cv=%d) for estimator %s",
+            "%s search over %d combinations (cv=%d, n_jobs=%s) for estimator %s",
+            search_strategy.capitalize(),
             total_combos,
             cv_splits,
+            n_jobs,
             estimator.__class__.__name__,
         )
 
-        for combo_idx, param_set in enumerate(param_grid, start=1):
-            estimator_clone = clone(estimator)
-            estimator_clone.set_params(**param_set)
-            scores = cross_val_score(
-                estimator_clone,
-                X,
-                y,
-                cv=cv_strategy,
-                scoring=scoring,
-                n_jobs=n_jobs,
-            )
-            mean_score = float(np.mean(scores))
-
-            if mean_score > best_score:
-                best_score = mean_score
-                best_params = param_set
-                best_estimator = estimator_clone
-
-            progress_ratio = combo_idx / total_combos
-            if (
-                snapshot_index < len(snapshot_steps)
-                and progress_ratio >= snapshot_steps[snapshot_index]
-            ):
-                logging.info(
-                    "Grid search progress: %.0f%% complete (%d / %d)",
-                    progress_ratio * 100,
-                    combo_idx,
-                    total_combos,
+        # One pool evaluates every (combo, fold) pair in a single dispatch;
+        # results stream back in grid order, so ties resolve exactly as in a
+        # sequential scan. max_nbytes/mmap_mode only apply when this pool
+        # really uses processes (trainer running targets inline); inside the
+        # per-target workers joblib runs it on threads sharing X/y in memory.
+        n_folds = len(cv_folds)
+        estimator_cls = type(estimator)
+        base_params = estimator.get_params(deep=False)
+        with Parallel(
+            n_jobs=n_jobs,
+            prefer="processes",
+            return_as="generator",
+            max_nbytes="1M",
+            mmap_mode="r",
+        ) as parallel:
+            fold_scores = parallel(
+                delayed(_fit_score_fold)(
+                    estimator_cls,
+                    base_params,
+                    param_set,
+                    X,
+                    y,
+                    train_idx,
+                    test_idx,
+                    scoring,
                 )
-                snapshot_index += 1
+                for param_set in param_grid
+                for train_idx, test_idx in cv_folds
+            )
 
-        if best_estimator is None:
+            for combo_idx, param_set in enumerate(param_grid, start=1):
+                mean_score = float(np.mean(list(islice(fold_scores, n_folds))))
+                combo_scores.append(mean_score)
+                if mean_score > best_score:
+                    best_score = mean_score
+                    best_params = param_set
+
+                if combo_idx in snapshot_combos:
+                    logging.info(
+                        "Grid search progress: %.0f%% complete (%d / %d)",
+                        combo_idx / total_combos * 100,
+                        combo_idx,
+                        total_combos,
+                    )
+
+        if best_params is None:
             raise BitAdmitAIException(
                 "Grid search failed to locate a valid estimator", sys
             )
@@ -202,43 +418,125 @@ class ModelTrainer:
             best_score,
             best_params,
         )
+        # Emitted once per search; formatting is deferred to the handler.
+        logging.debug("CV score per combination (grid order): %s", combo_scores)
 
+        # Fold models only saw part of the data, so the winner needs exactly
+        # one full refit.
+        best_estimator = clone(estimator).set_params(**best_params)
         best_estimator.fit(X, y)
 
-        return best_estimator, best_params
+        return best_estimator, best_params, best_score
+
+    @staticmethod
+    def _run_bayes_search(
+        estimator, search_params, X, y, cv, scoring, n_trials, random_state
+    ):
+        """Optuna TPE search over the configured candidate values.
+
+        Each hyperparameter is suggested as a categorical over its listed
+        values, so the search space matches the grid. Optuna is an optional
+        dependency, only imported when ``search_strategy: bayes`` is set.
+        """
+        try:
+            optuna = importlib.import_module("optuna")
+        except ImportError as exc:
+            raise BitAdmitAIException(
+                "search_strategy 'bayes' requires the optuna package", sys
+            ) from exc
+
+        def objective(trial):
+            param_set = {
+                name: trial.suggest_categorical(name, list(values))
+                for name, values in search_params.items()
+            }
+            return _score_params(estimator, param_set, X, y, cv, scoring)
+
+        study = optuna.create_study(
+            direction="maximize",
+            sampler=optuna.samplers.TPESampler(seed=random_state),
+        )
+        study.optimize(objective, n_trials=n_trials)
+        return study.best_params, study.best_value
 
     @staticmethod
     def _calculate_metrics(y_true, y_pred) -> Dict[str, float]:
+        # One confusion-matrix pass yields all three weighted metrics.
+        precision, recall, f1, _ = precision_recall_fscore_support(
+            y_true, y_pred, average="weighted", zero_division=0
+        )
         return {
-            "f1_score": f1_score(y_true, y_pred, average="weighted", zero_division=0),
-            "precision_score": precision_score(
-                y_true, y_pred, average="weighted", zero_division=0
-            ),
-            "recall_score": recall_score(
-                y_true, y_pred, average="weighted", zero_division=0
-            ),
+            "f1_score": float(f1),
+            "precision_score": float(precision),
+            "recall_score": float(recall),
         }
 
-    def _train_for_target(self, target_name, X_train, y_train, X_test, y_test):
-        num_classes = len(np.unique(y_train))
+    def _train_for_target(
+        self,
+        target_name,
+        X_train,
+        y_train,
+        X_test,
+        y_test,
+        num_classes,
+        n_jobs_inner=None,
+    ):
         best_model = None
         best_metrics: Dict[str, float] = {}
         best_score = -np.inf
 
         model_candidates = self.model_config.get("model_selection", {})
+        use_gpu = bool(self.model_config.get("use_gpu", False))
         if not model_candidates:
             raise BitAdmitAIException(
                 f"No model candidates provided for target '{target_name}'",
                 sys,
             )
 
+        candidates = []
         for model_key, model_info in model_candidates.items():
-            estimator = self._instantiate_estimator(model_info, num_classes)
             search_grid = model_info.get("search_param_grid", {})
-            trained_estimator, best_params = self._run_grid_search(
-                estimator, search_grid, X_train, y_train
+            serial_search = (
+                not search_grid
+                or not self.model_config.get("grid_search")
+                or self._search_n_jobs(n_jobs_inner) in (None, 1)
             )
+            estimator = self._instantiate_estimator(
+                model_info,
+                num_classes,
+                use_gpu=use_gpu,
+                # A parallel search already fills this target's cores, so each
+                # fit is kept single-threaded to avoid oversubscribing them.
+                estimator_n_jobs=(n_jobs_inner or -1) if serial_search else 1,
+            )
+            trained_estimator, best_params, cv_score = self._run_grid_search(
+                estimator, search_grid, X_train, y_train, n_jobs_inner=n_jobs_inner
+            )
+            if best_params:
+                logging.info("Best params for %s: %s", model_key, best_params)
+            candidates.append((model_key, trained_estimator, cv_score))
+
+        # Only the top-k candidates by CV score reach the test set; candidates
+        # trained without a search have no CV score and are always evaluated.
+        top_k = self.model_config.get("evaluate_top_k")
+        if top_k:
+            cv_ranked = sorted(
+                (c for c in candidates if c[2] is not None),
+                key=lambda candidate: candidate[2],
+                reverse=True,
+            )
+            skipped = {candidate[0] for candidate in cv_ranked[int(top_k) :]}
+            if skipped:
+                logging.info(
+                    "Skipping test evaluation for %s on target '%s' (outside top %s "
+                    "by CV score)",
+                    sorted(skipped),
+                    target_name,
+                    top_k,
+                )
+            candidates = [c for c in candidates if c[0] not in skipped]
 
+        for model_key, trained_estimator, _ in candidates:
             y_pred = trained_estimator.predict(X_test)
             metrics = self._calculate_metrics(y_test, y_pred)
 
@@ -248,8 +546,6 @@ class ModelTrainer:
                 target_name,
                 metrics,
             )
-            if best_params:
-                logging.info("Best params for %s: %s", model_key, best_params)
 
             if metrics["f1_score"] > best_score:
                 best_score = metrics["f1_score"]
@@ -290,17 +586,33 @@ class ModelTrainer:
                 test_arr, feature_count
             )
 
-            best_models: Dict[str, object] = {}
-            metrics_per_target: Dict[str, Dict[str, float]] = {}
-
-            for idx, target_name in enumerate(TARGET_COLUMNS):
-                y_train = y_train_matrix[:, idx].astype(int)
-                y_test = y_test_matrix[:, idx].astype(int)
-
-                best_model, target_metrics = self._train_for_target(
-                    target_name, X_train, y_train, X_test, y_test
+            # Targets share no state, so train them concurrently and split the
+            # cores between them for the nested grid searches.
+            total_cpus = os.cpu_count() or 1
+            n_jobs_outer = min(len(TARGET_COLUMNS), total_cpus)
+            n_jobs_inner = max(1, total_cpus // len(TARGET_COLUMNS))
+            # Labels are encoded as 0..k-1 with only a handful of classes, so
+            # int8 suffices and k is simply max + 1.
+            y_train_labels = y_train_matrix.astype(np.int8)
+            y_test_labels = y_test_matrix.astype(np.int8)
+            results = Parallel(n_jobs=n_jobs_outer, prefer="processes")(
+                delayed(self._train_for_target)(
+                    target_name,
+                    X_train,
+                    y_train_labels[:, idx],
+                    X_test,
+                    y_test_labels[:, idx],
+                    num_classes=int(y_train_labels[:, idx].max()) + 1,
+                    n_jobs_inner=n_jobs_inner,
                 )
+                for idx, target_name in enumerate(TARGET_COLUMNS)
+            )
 
+            best_models: Dict[str, object] = {}
+            metrics_per_target: Dict[str, Dict[str, float]] = {}
+            for target_name, (best_model, target_metrics) in zip(
+                TARGET_COLUMNS, results
+            ):
                 best_models[target_name] = best_model
                 metrics_per_target[target_name] = target_metrics
 
@@ -313,12 +625,17 @@ class ModelTrainer:
                 "models": best_models,
                 "target_value_map": target_value_map,
                 "target_columns": TARGET_COLUMNS,
-                "feature_names": preprocessor_bundle.get(
-                    "transformed_feature_names", []
-                ),
+                # Older bundles may be plain dicts; wrapping derives the names
+                # from the preprocessor when they were not stored.
+                "feature_names": PreprocessorBundle(
+                    preprocessor_bundle
+                ).transformed_feature_names,
             }
 
-            save_object(
+            # Pickling runs in the background, overlapping model evaluation.
+            # ModelPusher and load_object wait for it before touching the
+            # file, and TrainingPipline.run_pipeline waits before returning.
+            save_object_async(
                 self.model_trainer_config.trained_model_file_path,
                 model_package,
             )
@@ -3,10 +3,14 @@
 Provides MongoDbClient, a thin wrapper around a shared pymongo.MongoClient.
 - Reads connection info from SystemConfig (MONGODB_URL_KEY, DATABASE_NAME).
 - Uses certifi CA bundle for TLS.
+- Sizes the connection pool and negotiates wire compression from SystemConfig.
 - Raises BitAdmitAIException on misconfiguration or connection failures.
 """
 
+import importlib.util
 import sys
+from typing import List
+
 import pymongo
 import certifi
 from BIT_ADMIT_AI.entity.config import SystemConfig
@@ -15,6 +19,19 @@ from BIT_ADMIT_AI.logger import logging
 
 ca = certifi.where()
 
+# Compressors other than zlib need an extra package; pymongo warns otherwise.
+_COMPRESSOR_MODULES = {"zstd": "zstandard", "snappy": "snappy"}
+
+
+def _available_compressors(preferred: List[str]) -> List[str]:
+    """Keep only the compressors whose backing module is installed."""
+    return [
+        name
+        for name in preferred
+        if name not in _COMPRESSOR_MODULES
+        or importlib.util.find_spec(_COMPRESSOR_MODULES[name]) is not None
+    ]
+
 
 class MongoDbClient:
     """Create and manage a shared MongoDB client connection.
@@ -49,7 +66,18 @@ class MongoDbClient:
                     )
                 else:
                     MongoDbClient.client = pymongo.MongoClient(
-                        self.mongo_db_url, tlsCAFile=ca
+                        self.mongo_db_url,
+                        tlsCAFile=ca,
+                        maxPoolSize=system_config.MONGO_MAX_POOL_SIZE,
+                        minPoolSize=system_config.MONGO_MIN_POOL_SIZE,
+                        serverSelectionTimeoutMS=(
+                            system_config.MONGO_SERVER_SELECTION_TIMEOUT_MS
+                        ),
+                        compressors=_available_compressors(
+                            system_config.MONGO_COMPRESSORS
+                        ),
+                        retryReads=True,
+                        readPreference=system_config.MONGO_READ_PREFERENCE,
                     )
 
             self.client = MongoDbClient.client
@@ -59,5 +87,5 @@ class MongoDbClient:
             logging.info("DB connection made successfully.")
 
         except Exception as e:
-            logging.error(f"Error occurred during connection: {e}")
+            logging.error("Error occurred during connection: %s", e)
             raise BitAdmitAIException(e, sys)
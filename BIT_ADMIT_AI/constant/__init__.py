@@ -8,6 +8,9 @@ Environment:
 - DATABASE_NAME
 - COLLECTION_NAME
 - MONGODB_URL_KEY
+- BIT_ADMIT_CACHE (set to 1 to reuse fitted preprocessors and drift reports
+  across runs)
+- BIT_ADMIT_RUN_ID (optional; pins the artifact timestamp of a run)
 
 Note:
 - find_dotenv(raise_error_if_not_found=True) will raise if .env is missing.
@@ -26,6 +29,14 @@ if _dotenv_path:
 DATABASE_NAME: str = os.getenv("DATABASE_NAME", "")
 COLLECTION_NAME: str = os.getenv("COLLECTION_NAME", "")
 MONGODB_URL_KEY: str = os.getenv("MONGODB_URL_KEY", "")
+MONGO_MAX_POOL_SIZE: int = 16
+MONGO_MIN_POOL_SIZE: int = 4
+MONGO_SERVER_SELECTION_TIMEOUT_MS: int = 5000
+MONGO_COMPRESSORS: List[str] = ["zstd", "snappy", "zlib"]  # preference order
+MONGO_READ_PREFERENCE: str = "secondaryPreferred"
+# Read once and shared by every stage that caches across runs.
+CACHE_ENABLED: bool = os.getenv("BIT_ADMIT_CACHE", "0") == "1"
+RUN_ID_ENV_KEY: str = "BIT_ADMIT_RUN_ID"
 PIPELINE_NAME: str = "bit_admit_ai"
 ARTIFACT_DIR: str = "bit_artifact"
 MODEL_FILE_NAME: str = "model.pkl"
@@ -33,6 +44,8 @@ FILE_NAME = "admission_data.csv"
 TRAIN_FILE_NAME: str = "train.csv"
 TEST_FILE_NAME: str = "test.csv"
 TARGET_COLUMNS: List[str] = ["admission_decision", "scholarship_tier"]
+# Seed for the train/test split and for estimators that leave random_state unset
+RANDOM_STATE: int = 42
 PREPROCESSING_OBJ_FILE: str = "preprocessing.pkl"
 SCHEMA_PATH = os.path.join("config", "schema.yaml")
 
@@ -42,18 +55,27 @@ DA_DIR_NAME: str = os.getenv("COLLECTION_NAME", "unknown_collection").lower()
 DA_FEATURE_STORE_DIR: str = "feature_store"
 DA_INGESTED_DIR: str = "ingested_data"
 DA_TRAIN_TEST_TEST_RATIO: float = 0.2
+DA_ARTIFACT_FORMAT: str = "parquet"  # one of: csv, parquet, feather
+DA_MONGO_BATCH_SIZE: int = 10000
 
 
 # Data validation
 DATA_VAL_DIR_NAME: str = "data_validation"
 DATA_DRIFT_REPORT_DIR: str = "drift_report"
 DATA_DRIFT_REPORT_FILE_NAME: str = "report.yaml"
+DATA_DRIFT_MAX_WORKERS: int = os.cpu_count() or 1
+DATA_DRIFT_SHARD_MIN_COLUMNS: int = 32  # narrower frames run in one process
+DATA_VAL_CACHE_ENABLED: bool = CACHE_ENABLED
+DATA_VAL_CACHE_DIR: str = os.path.join(ARTIFACT_DIR, "cache", DATA_VAL_DIR_NAME)
 
 
 # Data transformation
 DATA_TRANS_DIR_NAME: str = "data_transformation"
 DATA_TRANS_TRANSFORMED_DATA_DIR: str = "transformed"
 DATA_TRANS_TRANSFORMED_OBJECT_DIR: str = "transformed_object"
+DATA_TRANS_ARRAY_FORMAT: str = "npz"  # "npz" (sparse CSR), "arrow" or "npy"
+DATA_TRANS_CACHE_ENABLED: bool = CACHE_ENABLED
+DATA_TRANS_CACHE_DIR: str = os.path.join(ARTIFACT_DIR, "cache", DATA_TRANS_DIR_NAME)
 
 # Model training
 MODEL_TRAINER_DIR_NAME: str = "model_trainer"
@@ -69,7 +91,7 @@ EVAL_CHANGED_THRESHOLD_SCORE: float = 0.07
 # Model pusher (currently saved locally but will be the place to look during deployment)
 BEST_MODEL_DIR: str = "best_model"
 BEST_MODEL_FILE: str = "model.pkl"
-BEST_MODEL_METADATA_FILE: str = "metrics.yaml"
+BEST_MODEL_METADATA_FILE: str = "metrics.json"
 BEST_MODEL_PATH: str = os.path.join(BEST_MODEL_DIR, BEST_MODEL_FILE)
 BEST_MODEL_METADATA_PATH: str = os.path.join(BEST_MODEL_DIR, BEST_MODEL_METADATA_FILE)
 
@@ -2,18 +2,53 @@
 
 Provides DataAccessAndHandling to pull MongoDB collections into pandas DataFrames.
 - Connects via MongoDbClient using SystemConfig.
-- Drops MongoDB "_id" and normalizes "na" to NaN.
+- Streams the cursor in batches into Arrow tables before converting to pandas.
+- Drops MongoDB "_id" server-side and nulls "na" strings column-wise.
 - Raises BitAdmitAIException on failures.
 """
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 import sys
-from typing import Optional
+from itertools import islice
+from typing import List, Optional
 
 from BIT_ADMIT_AI.configration.mongo_connect import MongoDbClient
+from BIT_ADMIT_AI.constant import DA_MONGO_BATCH_SIZE
 from BIT_ADMIT_AI.entity.config import SystemConfig
 from BIT_ADMIT_AI.exceptions import BitAdmitAIException
+from BIT_ADMIT_AI.logger import logging
+from BIT_ADMIT_AI.utils.main_utils import table_to_dataframe
+
+
+def _null_na_strings(table: pa.Table) -> pa.Table:
+    """Turn literal "na" values in string columns into Arrow nulls.
+
+    Only string columns can hold "na", so numeric columns are never scanned.
+    """
+    for index, field in enumerate(table.schema):
+        if pa.types.is_string(field.type) or pa.types.is_large_string(field.type):
+            column = table.column(index)
+            table = table.set_column(
+                index,
+                field,
+                pc.if_else(pc.equal(column, "na"), pa.scalar(None, field.type), column),
+            )
+    return table
+
+
+def _documents_to_table(documents: List[dict]) -> pa.Table:
+    """Build an Arrow table from a batch of documents.
+
+    Columns are the union of keys across the batch, in first-seen order, as
+    with ``pd.DataFrame(documents)``; documents lacking a key get nulls.
+    """
+    keys = dict.fromkeys(key for document in documents for key in document)
+    return pa.Table.from_pydict(
+        {key: [document.get(key) for document in documents] for key in keys}
+    )
 
 
 class DataAccessAndHandling:
@@ -36,15 +71,22 @@ class DataAccessAndHandling:
             raise BitAdmitAIException(e, sys)
 
     def collection_to_dataframe(
-        self, collection_name: str, database_name: Optional[str] = None
+        self,
+        collection_name: str,
+        database_name: Optional[str] = None,
+        batch_size: int = DA_MONGO_BATCH_SIZE,
     ) -> pd.DataFrame:
         """Load a MongoDB collection into a pandas DataFrame.
 
-        Drops "_id" if present and replaces string "na" with NaN.
+        Documents are pulled ``batch_size`` at a time and each batch becomes
+        an Arrow table, so the full list of documents is never held at once.
+        Falls back to per-batch pandas frames if Arrow cannot type a batch.
+        Drops "_id" and replaces string "na" with missing values.
 
         Args:
             collection_name: Name of the collection to read.
             database_name: Optional database override; defaults to the configured database.
+            batch_size: Cursor batch size and number of documents per Arrow batch.
 
         Returns:
             pandas.DataFrame: Collection data.
@@ -56,10 +98,31 @@ class DataAccessAndHandling:
             target_db = database_name or self.database_name
             collection = self.mongo_client.client[target_db][collection_name]
 
-            df = pd.DataFrame(list(collection.find()))
-            if "_id" in df.columns.to_list():
-                df = df.drop(columns=["_id"], axis=1)
-            df.replace({"na": np.nan}, inplace=True)
+            try:
+                cursor = collection.find({}, {"_id": 0}, batch_size=batch_size)
+                tables = []
+                while chunk := list(islice(cursor, batch_size)):
+                    tables.append(_documents_to_table(chunk))
+                if tables:
+                    # Batches may differ in columns; missing ones are null-filled.
+                    table = pa.concat_tables(tables, promote_options="permissive")
+                    df = table_to_dataframe(_null_na_strings(table))
+                else:
+                    df = pd.DataFrame()
+            except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+                logging.warning("Arrow batch conversion failed (%s); using pandas", e)
+                # Same batching as the Arrow path: one batch of dicts at a time.
+                cursor = collection.find({}, {"_id": 0}, batch_size=batch_size)
+                frames = []
+                while chunk := list(islice(cursor, batch_size)):
+                    frames.append(pd.DataFrame(chunk))
+                df = (
+                    pd.concat(frames, ignore_index=True, copy=False)
+                    if frames
+                    else pd.DataFrame()
+                )
+                object_columns = df.select_dtypes(include="object").columns
+                df[object_columns] = df[object_columns].replace({"na": np.nan})
 
             return df
 
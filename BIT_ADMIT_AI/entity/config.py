@@ -4,19 +4,36 @@ Centralizes paths, filenames through:
 ingestion, validation, transformation, training, evaluation, and model push.
 
 Notes:
-- TIME_STAMP is embedded in artifact_dir to keep runs isolated.
+- TIME_STAMP is embedded in artifact_dir to keep runs isolated. It is fixed
+  once per run: taken from BIT_ADMIT_RUN_ID when set, otherwise generated and
+  exported there so reloads and child processes resolve the same run.
+- Run-scoped paths are cached properties derived from ``training_config`` on
+  first access, so a stage only builds the paths it actually uses (those
+  configs need an instance ``__dict__``; PTrainingConfig uses slots).
 - Environment-driven constants are imported from BIT_ADMIT_AI.constant.
 """
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property, lru_cache
 from BIT_ADMIT_AI.constant import *
 
-TIME_STAMP: str = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
 
+@lru_cache(maxsize=1)
+def _run_timestamp() -> str:
+    """Timestamp identifying the current run (one per process tree)."""
+    run_id = os.environ.get(RUN_ID_ENV_KEY)
+    if not run_id:
+        run_id = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        os.environ[RUN_ID_ENV_KEY] = run_id
+    return run_id
 
-@dataclass
+
+TIME_STAMP: str = _run_timestamp()
+
+
+@dataclass(slots=True)
 class PTrainingConfig:
     """Training pipeline configuration.
 
@@ -39,25 +56,49 @@ class DataIngestionConfig:
     """Data ingestion configuration.
 
     Attributes:
-        ingestion_dir: Base dir for ingestion artifacts.
-        feature_store_dir: Path to the raw feature store CSV.
-        training_file_path: Path to the train split CSV.
-        test_file_path: Path to the test split CSV.
+        training_config: Run whose artifact_dir roots the paths below.
+        artifact_format: File format of the persisted tables (csv/parquet/feather).
         test_ratio: Fraction for test split.
         collection_name: MongoDB collection name to read from.
+        ingestion_dir: Base dir for ingestion artifacts.
+        feature_store_dir: Path to the raw feature store file.
+        training_file_path: Path to the train split file.
+        test_file_path: Path to the test split file.
     """
 
-    ingestion_dir: str = os.path.join(training_config.artifact_dir, DA_DIR_NAME)
-    feature_store_dir: str = os.path.join(
-        ingestion_dir, DA_FEATURE_STORE_DIR, FILE_NAME
-    )
-    training_file_path: str = os.path.join(
-        ingestion_dir, DA_INGESTED_DIR, TRAIN_FILE_NAME
-    )
-    test_file_path: str = os.path.join(ingestion_dir, DA_INGESTED_DIR, TEST_FILE_NAME)
+    training_config: PTrainingConfig = field(default_factory=lambda: training_config)
+    artifact_format: str = DA_ARTIFACT_FORMAT
     test_ratio: float = DA_TRAIN_TEST_TEST_RATIO
     collection_name: str = DA_COLLECTION_NAME
 
+    @cached_property
+    def ingestion_dir(self) -> str:
+        return os.path.join(self.training_config.artifact_dir, DA_DIR_NAME)
+
+    @cached_property
+    def feature_store_dir(self) -> str:
+        return os.path.join(
+            self.ingestion_dir,
+            DA_FEATURE_STORE_DIR,
+            FILE_NAME.replace("csv", self.artifact_format),
+        )
+
+    @cached_property
+    def training_file_path(self) -> str:
+        return os.path.join(
+            self.ingestion_dir,
+            DA_INGESTED_DIR,
+            TRAIN_FILE_NAME.replace("csv", self.artifact_format),
+        )
+
+    @cached_property
+    def test_file_path(self) -> str:
+        return os.path.join(
+            self.ingestion_dir,
+            DA_INGESTED_DIR,
+            TEST_FILE_NAME.replace("csv", self.artifact_format),
+        )
+
 
 @dataclass
 class SystemConfig:
@@ -67,11 +108,21 @@ class SystemConfig:
         DATABASE_NAME: Default MongoDB database name.
         COLLECTION_NAME: Default MongoDB collection name.
         MONGODB_URL_KEY: Env var key containing the Mongo connection string.
+        MONGO_MAX_POOL_SIZE: Upper bound on pooled connections.
+        MONGO_MIN_POOL_SIZE: Connections kept warm in the pool.
+        MONGO_SERVER_SELECTION_TIMEOUT_MS: Fail fast if no server is reachable.
+        MONGO_COMPRESSORS: Wire compressors to offer, in preference order.
+        MONGO_READ_PREFERENCE: Replica-set member to read from.
     """
 
     DATABASE_NAME = DATABASE_NAME
     COLLECTION_NAME = COLLECTION_NAME
     MONGODB_URL_KEY = MONGODB_URL_KEY
+    MONGO_MAX_POOL_SIZE = MONGO_MAX_POOL_SIZE
+    MONGO_MIN_POOL_SIZE = MONGO_MIN_POOL_SIZE
+    MONGO_SERVER_SELECTION_TIMEOUT_MS = MONGO_SERVER_SELECTION_TIMEOUT_MS
+    MONGO_COMPRESSORS = MONGO_COMPRESSORS
+    MONGO_READ_PREFERENCE = MONGO_READ_PREFERENCE
 
 
 @dataclass
@@ -79,16 +130,32 @@ class DataValidationConfig:
     """Data validation configuration.
 
     Attributes:
+        training_config: Run whose artifact_dir roots the paths below.
+        drift_max_workers: Upper bound on processes used for drift profiling.
+        drift_shard_min_columns: Minimum columns per drift shard.
+        cache_enabled: Reuse drift reports for identical reference/current data.
+        cache_dir: Directory holding cached drift reports.
         data_validation_dir: Base dir for validation artifacts.
         drift_report_file_path: Path to the data drift report file.
     """
 
-    data_validation_dir: str = os.path.join(
-        training_config.artifact_dir, DATA_VAL_DIR_NAME
-    )
-    drift_report_file_path: str = os.path.join(
-        data_validation_dir, DATA_DRIFT_REPORT_DIR, DATA_DRIFT_REPORT_FILE_NAME
-    )
+    training_config: PTrainingConfig = field(default_factory=lambda: training_config)
+    drift_max_workers: int = DATA_DRIFT_MAX_WORKERS
+    drift_shard_min_columns: int = DATA_DRIFT_SHARD_MIN_COLUMNS
+    cache_enabled: bool = DATA_VAL_CACHE_ENABLED
+    cache_dir: str = DATA_VAL_CACHE_DIR
+
+    @cached_property
+    def data_validation_dir(self) -> str:
+        return os.path.join(self.training_config.artifact_dir, DATA_VAL_DIR_NAME)
+
+    @cached_property
+    def drift_report_file_path(self) -> str:
+        return os.path.join(
+            self.data_validation_dir,
+            DATA_DRIFT_REPORT_DIR,
+            DATA_DRIFT_REPORT_FILE_NAME,
+        )
 
 
 @dataclass
@@ -96,30 +163,46 @@ class DataTransformationConfig:
     """Data transformation configuration.
 
     Attributes:
+        training_config: Run whose artifact_dir roots the paths below.
+        cache_enabled: Reuse fitted preprocessors for identical training inputs.
+        cache_dir: Run-independent directory holding cached preprocessor fits.
         data_transformation_dir: Base dir for transformation artifacts.
-        transformed_train_file_path: Path to transformed train (.npy).
-        transformed_test_file_path: Path to transformed test (.npy).
+        transformed_train_file_path: Path to transformed train (.npz/.arrow/.npy).
+        transformed_test_file_path: Path to transformed test (.npz/.arrow/.npy).
         transformed_object_file_path: Path to the fitted preprocessing object.
     """
 
-    data_transformation_dir: str = os.path.join(
-        training_config.artifact_dir, DATA_TRANS_DIR_NAME
-    )
-    transformed_train_file_path: str = os.path.join(
-        data_transformation_dir,
-        DATA_TRANS_TRANSFORMED_DATA_DIR,
-        TRAIN_FILE_NAME.replace("csv", "npy"),
-    )
-    transformed_test_file_path: str = os.path.join(
-        data_transformation_dir,
-        DATA_TRANS_TRANSFORMED_DATA_DIR,
-        TEST_FILE_NAME.replace("csv", "npy"),
-    )
-    transformed_object_file_path: str = os.path.join(
-        data_transformation_dir,
-        DATA_TRANS_TRANSFORMED_OBJECT_DIR,
-        PREPROCESSING_OBJ_FILE,
-    )
+    training_config: PTrainingConfig = field(default_factory=lambda: training_config)
+    cache_enabled: bool = DATA_TRANS_CACHE_ENABLED
+    cache_dir: str = DATA_TRANS_CACHE_DIR
+
+    @cached_property
+    def data_transformation_dir(self) -> str:
+        return os.path.join(self.training_config.artifact_dir, DATA_TRANS_DIR_NAME)
+
+    @cached_property
+    def transformed_train_file_path(self) -> str:
+        return os.path.join(
+            self.data_transformation_dir,
+            DATA_TRANS_TRANSFORMED_DATA_DIR,
+            TRAIN_FILE_NAME.replace("csv", DATA_TRANS_ARRAY_FORMAT),
+        )
+
+    @cached_property
+    def transformed_test_file_path(self) -> str:
+        return os.path.join(
+            self.data_transformation_dir,
+            DATA_TRANS_TRANSFORMED_DATA_DIR,
+            TEST_FILE_NAME.replace("csv", DATA_TRANS_ARRAY_FORMAT),
+        )
+
+    @cached_property
+    def transformed_object_file_path(self) -> str:
+        return os.path.join(
+            self.data_transformation_dir,
+            DATA_TRANS_TRANSFORMED_OBJECT_DIR,
+            PREPROCESSING_OBJ_FILE,
+        )
 
 
 @dataclass
@@ -127,21 +210,27 @@ class ModelTrainerConfig:
     """Model trainer configuration.
 
     Attributes:
-        model_trainer_dir: Base dir for training artifacts.
-        trained_model_file_path: Path to persist the trained model.
+        training_config: Run whose artifact_dir roots the paths below.
         expected_accuracy: Minimum acceptable score to consider the model valid.
         model_config_file_path: Path to model hyperparameter config.
+        model_trainer_dir: Base dir for training artifacts.
+        trained_model_file_path: Path to persist the trained model.
     """
 
-    model_trainer_dir: str = os.path.join(
-        training_config.artifact_dir, MODEL_TRAINER_DIR_NAME
-    )
-    trained_model_file_path: str = os.path.join(
-        model_trainer_dir, MODEL_TRAINER_TRAINED_MODEL_DIR, MODEL_FILE_NAME
-    )
+    training_config: PTrainingConfig = field(default_factory=lambda: training_config)
     expected_accuracy: float = MODEL_TRAINER_EXPECTED_SCORE
     model_config_file_path: str = MODEL_TRAINER_MODEL_CONFIG_FILE_PATH
 
+    @cached_property
+    def model_trainer_dir(self) -> str:
+        return os.path.join(self.training_config.artifact_dir, MODEL_TRAINER_DIR_NAME)
+
+    @cached_property
+    def trained_model_file_path(self) -> str:
+        return os.path.join(
+            self.model_trainer_dir, MODEL_TRAINER_TRAINED_MODEL_DIR, MODEL_FILE_NAME
+        )
+
 
 @dataclass
 class ModelEvaluationConfig:
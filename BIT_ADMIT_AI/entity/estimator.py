@@ -5,14 +5,19 @@ Wraps a scikit-learn LabelEncoder per target column and:
 - decoding of encoded predictions,
 - access to integer-to-label mappings.
 
+Also provides PreprocessorBundle, the dict persisted alongside a fitted
+preprocessor, with lazily derived feature names.
+
 All methods raise BitAdmitAIException on failure.
 """
 
+import os
 import sys
-from typing import Dict, Iterable, List, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed
 from sklearn.preprocessing import LabelEncoder
 
 from BIT_ADMIT_AI.exceptions import BitAdmitAIException
@@ -26,10 +31,26 @@ class TargetValueMap:
 
     Attributes:
         _encoders: Internal mapping of column -> LabelEncoder.
+        _classes: Column -> the encoder's ``classes_``; decoding indexes these
+            directly instead of going through ``inverse_transform``.
+        _mapping_cache: ``mapping()`` result, built on first call.
     """
 
     def __init__(self, encoders: Dict[str, LabelEncoder]):
         self._encoders = encoders
+        self._classes = self._collect_classes(encoders)
+        self._mapping_cache: Optional[Dict[str, Dict[int, str]]] = None
+
+    @staticmethod
+    def _collect_classes(encoders: Dict[str, LabelEncoder]) -> Dict[str, np.ndarray]:
+        return {column: encoder.classes_ for column, encoder in encoders.items()}
+
+    def __setstate__(self, state: dict) -> None:
+        # Bundles pickled before ``_classes`` existed only carry the encoders.
+        self.__dict__.update(state)
+        if "_classes" not in state:
+            self._classes = self._collect_classes(self._encoders)
+        self.__dict__.setdefault("_mapping_cache", None)
 
     @classmethod
     def fit(cls, targets: pd.DataFrame) -> Tuple["TargetValueMap", pd.DataFrame]:
@@ -47,18 +68,32 @@ class TargetValueMap:
             BitAdmitAIException: If fitting fails.
         """
         try:
-            encoded = targets.copy()
-            encoders: Dict[str, LabelEncoder] = {}
-
-            for column in targets.columns:
-                encoder = LabelEncoder()
-                encoded[column] = encoder.fit_transform(targets[column])
-                encoders[column] = encoder
+            # Columns factorize independently; n_jobs=1 runs them inline.
+            n_jobs = max(1, min(len(targets.columns), os.cpu_count() or 1))
+            results = Parallel(n_jobs=n_jobs, prefer="threads")(
+                delayed(cls._fit_column)(column, targets[column])
+                for column in targets.columns
+            )
 
-            return cls(encoders), encoded
+            encoded = {column: codes for column, codes, _ in results}
+            encoders = {column: encoder for column, _, encoder in results}
+            return cls(encoders), pd.DataFrame(encoded, index=targets.index)
         except Exception as exc:
             raise BitAdmitAIException(exc, sys) from exc
 
+    @staticmethod
+    def _fit_column(
+        column: str, values: pd.Series
+    ) -> Tuple[str, np.ndarray, LabelEncoder]:
+        # One hash-based factorization; categories come out sorted, as
+        # LabelEncoder orders them, so the codes are interchangeable.
+        categorical = pd.Categorical(values)
+        if (categorical.codes < 0).any():
+            raise ValueError(f"Target column '{column}' contains missing labels")
+        encoder = LabelEncoder()
+        encoder.classes_ = np.asarray(categorical.categories, dtype=object)
+        return column, categorical.codes.astype(np.int64), encoder
+
     def transform(self, targets: pd.DataFrame) -> pd.DataFrame:
         """Encode target columns using fitted encoders.
 
@@ -72,10 +107,12 @@ class TargetValueMap:
             BitAdmitAIException: If transform fails or unseen labels are present.
         """
         try:
-            encoded = targets.copy()
+            # Build the output column-wise instead of copying every block and
+            # overwriting it; untouched columns are carried over as-is.
+            encoded = {column: targets[column] for column in targets.columns}
             for column, encoder in self._encoders.items():
-                encoded[column] = encoder.transform(targets[column])
-            return encoded
+                encoded[column] = encoder.transform(targets[column].to_numpy())
+            return pd.DataFrame(encoded, index=targets.index)
         except Exception as exc:
             raise BitAdmitAIException(exc, sys) from exc
 
@@ -92,10 +129,10 @@ class TargetValueMap:
             BitAdmitAIException: If decoding fails.
         """
         try:
-            decoded = encoded.copy()
-            for column, encoder in self._encoders.items():
-                decoded[column] = encoder.inverse_transform(encoded[column])
-            return decoded
+            decoded = {column: encoded[column] for column in encoded.columns}
+            for column, classes in self._classes.items():
+                decoded[column] = classes[encoded[column].to_numpy()]
+            return pd.DataFrame(decoded, index=encoded.index)
         except Exception as exc:
             raise BitAdmitAIException(exc, sys) from exc
 
@@ -117,25 +154,68 @@ class TargetValueMap:
         try:
             decoded = {}
             for column, value in zip(order, encoded_values):
-                encoder = self._encoders[column]
-                decoded[column] = encoder.inverse_transform(np.array([value]))[0]
+                decoded[column] = self._classes[column][value]
             return decoded
         except Exception as exc:
             raise BitAdmitAIException(exc, sys) from exc
 
+    def decode_scalar(self, column: str, value: int) -> str:
+        """Decode one predicted integer for ``column`` without array round trips.
+
+        Args:
+            column: Target column name.
+            value: Encoded prediction.
+
+        Returns:
+            str: Original label.
+
+        Raises:
+            BitAdmitAIException: If the column or value is unknown.
+        """
+        try:
+            return self._classes[column][value]
+        except Exception as exc:
+            raise BitAdmitAIException(exc, sys) from exc
+
+    def decode_array(self, column: str, values: np.ndarray) -> np.ndarray:
+        """Decode an array of predicted integers for ``column`` in one take.
+
+        Args:
+            column: Target column name.
+            values: Encoded predictions (any integer array-like).
+
+        Returns:
+            numpy.ndarray: Original labels, aligned with ``values``.
+
+        Raises:
+            BitAdmitAIException: If the column or a value is unknown.
+        """
+        try:
+            return self._classes[column].take(np.asarray(values, dtype=np.intp))
+        except Exception as exc:
+            raise BitAdmitAIException(exc, sys) from exc
+
     def mapping(self) -> Dict[str, Dict[int, str]]:
         """Get integer-to-label mapping for each target column.
 
+        The encoders are fixed once fitted, so the mapping is built on the
+        first call and the same (read-only) dict is returned afterwards.
+
         Returns:
             Dict[column, Dict[encoded_int, label_str]].
 
         """
+        if self._mapping_cache is not None:
+            return self._mapping_cache
+
         mapping: Dict[str, Dict[int, str]] = {}
         for column, encoder in self._encoders.items():
-            encoded_values = encoder.transform(encoder.classes_)
+            # LabelEncoder codes are positions in ``classes_`` by construction.
+            encoded_values = np.arange(len(encoder.classes_))
             mapping[column] = dict(
                 zip(encoded_values.tolist(), encoder.classes_.tolist())
             )
+        self._mapping_cache = mapping
         return mapping
 
     def encoders(self) -> Dict[str, LabelEncoder]:
@@ -145,3 +225,30 @@ class TargetValueMap:
             Dict[str, LabelEncoder]: Column -> fitted encoder.
         """
         return self._encoders
+
+
+class PreprocessorBundle(dict):
+    """Persisted mapping that holds a fitted ``"preprocessor"``.
+
+    Behaves as a plain dict. Transformed feature names are not stored up front;
+    ``transformed_feature_names`` derives them from the preprocessor on first
+    access and caches them in the mapping.
+    """
+
+    FEATURE_NAMES_KEY = "transformed_feature_names"
+
+    @property
+    def transformed_feature_names(self) -> List[str]:
+        """Output feature names of the fitted preprocessor.
+
+        Returns:
+            List[str]: Names from ``get_feature_names_out``, or an empty list if
+            the preprocessor cannot provide them.
+        """
+        if self.FEATURE_NAMES_KEY not in self:
+            try:
+                names = self["preprocessor"].get_feature_names_out().tolist()
+            except Exception:  # pragma: no cover - optional metadata
+                names = []
+            self[self.FEATURE_NAMES_KEY] = names
+        return self[self.FEATURE_NAMES_KEY]
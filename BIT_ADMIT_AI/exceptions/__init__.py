@@ -6,25 +6,43 @@ import sys
 from BIT_ADMIT_AI.logger import logging
 
 
-# Figure out the error
-def error_message_detail(error):
+def _error_location():
+    """Return ``(file_name, line)`` of the exception currently being handled."""
     _, _, exc_tb = sys.exc_info()
-    if exc_tb is not None:
-        file_name = exc_tb.tb_frame.f_code.co_filename
-        line = exc_tb.tb_lineno
-    else:
-        file_name = "Unknown"
-        line = "Unknown"
-    error_message = f"Error occurred in [{file_name}] line [{line}] message [{error}]"
-    logging.error(error_message)
-    return error_message
+    if exc_tb is None:
+        return "Unknown", "Unknown"
+    return exc_tb.tb_frame.f_code.co_filename, exc_tb.tb_lineno
+
+
+# Figure out the error
+def error_message_detail(error, location=None):
+    file_name, line = location or _error_location()
+    return f"Error occurred in [{file_name}] line [{line}] message [{error}]"
 
 
 class BitAdmitAIException(Exception):
-    def __init__(self, error_message, sys):
-        """param: error_mesage: str format of the error from the error_message_detail()"""
+    def __init__(self, error_message, sys=None):
+        """param: error_mesage: the caught error (or a message string).
+
+        The raising location is captured and logged here; the message string
+        is only built on first ``str()``. ``sys`` is accepted for the existing
+        ``BitAdmitAIException(e, sys)`` call sites and is not used.
+        """
         super().__init__(error_message)
-        self.error_message = error_message_detail(error_message)
+        self.error = error_message
+        self._location = _error_location()
+        self._formatted = None
+        logging.error(
+            "Error occurred in [%s] line [%s] message [%s]",
+            *self._location,
+            error_message,
+        )
+
+    @property
+    def error_message(self):
+        if self._formatted is None:
+            self._formatted = error_message_detail(self.error, self._location)
+        return self._formatted
 
     def __str__(self):
         return self.error_message
@@ -1,37 +1,76 @@
-import logging
+import logging as _std_logging
 import os
 from datetime import datetime
-
-from from_root import from_root
-from rich.console import Console
-from rich.logging import RichHandler
+from functools import lru_cache
 
 # logging file setup
 log_dir = "logs"
 log_file_name = f"{datetime.now().strftime('%Y-%m-%d-%H-%M-%S')}.log"
-log_dir_path = os.path.join(from_root(), log_dir)
-log_file_path = os.path.join(log_dir_path, log_file_name)
-
-os.makedirs(log_dir_path, exist_ok=True)
 
-console = Console()
+# Console threshold; e.g. WARNING keeps INFO-heavy runs off the console.
+CONSOLE_LOG_LEVEL_ENV_KEY = "BIT_ADMIT_CONSOLE_LOG_LEVEL"
+# "1" swaps the plain console handler for Rich (colours, rich tracebacks).
+RICH_LOGS_ENV_KEY = "BIT_ADMIT_RICH_LOGS"
 
-file_handler = logging.FileHandler(log_file_path)
-file_handler.setLevel(logging.DEBUG)
-file_handler.setFormatter(
-    logging.Formatter("[ %(levelname)s ] - %(asctime)s - %(name)s - %(message)s")
+# Module-level calls that emit a record; the first one configures handlers.
+_LOG_CALLS = frozenset(
+    {"debug", "info", "warning", "warn", "error", "exception", "critical", "log"}
 )
 
-rich_handler = RichHandler(
-    console=console,
-    rich_tracebacks=True,
-    markup=False,
-    show_time=False,
-    show_path=False,
-)
-rich_handler.setLevel(logging.INFO)
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    handlers=[file_handler, rich_handler],
-)
+@lru_cache(maxsize=1)
+def _configure() -> None:
+    """Create the log file and attach the file + console handlers (once)."""
+    from from_root import from_root
+
+    log_dir_path = os.path.join(from_root(), log_dir)
+    log_file_path = os.path.join(log_dir_path, log_file_name)
+
+    os.makedirs(log_dir_path, exist_ok=True)
+
+    file_handler = _std_logging.FileHandler(log_file_path)
+    file_handler.setLevel(_std_logging.DEBUG)
+    file_handler.setFormatter(
+        _std_logging.Formatter(
+            "[ %(levelname)s ] - %(asctime)s - %(name)s - %(message)s"
+        )
+    )
+
+    if os.getenv(RICH_LOGS_ENV_KEY) == "1":
+        from rich.console import Console
+        from rich.logging import RichHandler
+
+        console_handler = RichHandler(
+            console=Console(),
+            rich_tracebacks=True,
+            markup=False,
+            show_time=False,
+            show_path=False,
+        )
+    else:
+        console_handler = _std_logging.StreamHandler()
+    console_handler.setLevel(
+        os.getenv(CONSOLE_LOG_LEVEL_ENV_KEY, "INFO").strip().upper() or "INFO"
+    )
+
+    _std_logging.basicConfig(
+        level=_std_logging.DEBUG,
+        handlers=[file_handler, console_handler],
+    )
+
+
+class _LazyLogging:
+    """Stand-in for the stdlib ``logging`` module that configures on first use.
+
+    Importing the package no longer touches the filesystem; the ``logs/``
+    directory and handlers are created by the first ``logging.info`` (or any
+    other emitting call). Every other attribute is the stdlib's own.
+    """
+
+    def __getattr__(self, name):
+        if name in _LOG_CALLS:
+            _configure()
+        return getattr(_std_logging, name)
+
+
+logging = _LazyLogging()
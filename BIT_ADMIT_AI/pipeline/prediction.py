@@ -1,9 +1,12 @@
+import os
 import sys
-from dataclasses import dataclass, asdict
-from typing import Dict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
+from scipy import sparse
 
 from BIT_ADMIT_AI.constant import TARGET_COLUMNS, BEST_MODEL_PATH
 from BIT_ADMIT_AI.components.data_transformation import DataTransformation
@@ -12,7 +15,7 @@ from BIT_ADMIT_AI.exceptions import BitAdmitAIException
 from BIT_ADMIT_AI.utils.main_utils import load_object
 
 
-@dataclass
+@dataclass(slots=True)
 class BitAdmitFeatures:
     """Container for incoming application features."""
 
@@ -30,17 +33,108 @@ class BitAdmitFeatures:
     english_score: float
     chinese_proficiency: str
 
+    def to_row(self, columns: Optional[Sequence[str]] = None) -> Tuple[object, ...]:
+        """Return the field values as a tuple in ``columns`` order.
+
+        Args:
+            columns: Field names to emit; defaults to the declared field order.
+        """
+        return tuple(getattr(self, name) for name in columns or FEATURE_COLUMNS)
+
     def to_dataframe(self) -> pd.DataFrame:
-        return pd.DataFrame([asdict(self)])
+        # Column-wise construction skips asdict's recursive copy and the
+        # row-of-records path pandas takes for ``DataFrame([dict])``.
+        row = self.to_row()
+        return pd.DataFrame(
+            {name: [value] for name, value in zip(FEATURE_COLUMNS, row)}
+        )
 
     def to_dict(self) -> Dict[str, object]:
-        return asdict(self)
+        # Flat fields only, so asdict's recursive copy buys nothing here.
+        return {name: getattr(self, name) for name in FEATURE_COLUMNS}
+
+
+FEATURE_COLUMNS: Tuple[str, ...] = tuple(f.name for f in fields(BitAdmitFeatures))
+_FLOAT_FEATURES = frozenset(f.name for f in fields(BitAdmitFeatures) if f.type is float)
+
+
+@dataclass(slots=True)
+class BitAdmitFeaturesBatch:
+    """Column-wise (one array per field) container for a batch of applications.
+
+    Mirrors :class:`BitAdmitFeatures`, but holds one NumPy array per field
+    (float64 for numeric fields, object otherwise) rather than one object per
+    application, so the frame for the preprocessor wraps the arrays directly.
+    """
+
+    program_category: np.ndarray
+    country: np.ndarray
+    bit_program_applied: np.ndarray
+    degree_language: np.ndarray
+    previous_gpa: np.ndarray
+    math_physics_background_score: np.ndarray
+    research_alignment_score: np.ndarray
+    publication_count: np.ndarray
+    recommendation_strength: np.ndarray
+    interview_score: np.ndarray
+    english_test_type: np.ndarray
+    english_score: np.ndarray
+    chinese_proficiency: np.ndarray
+
+    @classmethod
+    def _from_rows(cls, rows: List[Sequence[object]]) -> "BitAdmitFeaturesBatch":
+        columns = list(zip(*rows)) or [()] * len(FEATURE_COLUMNS)
+        return cls(
+            *(
+                np.asarray(
+                    values, dtype=np.float64 if name in _FLOAT_FEATURES else object
+                )
+                for name, values in zip(FEATURE_COLUMNS, columns)
+            )
+        )
+
+    @classmethod
+    def from_records(
+        cls, records: Sequence[Mapping[str, object]]
+    ) -> "BitAdmitFeaturesBatch":
+        """Build the batch from feature dicts (e.g. a JSON payload) in one pass.
+
+        Args:
+            records: One mapping per application with every feature field;
+                extra keys are ignored.
+
+        Raises:
+            KeyError: If a record lacks a feature field.
+        """
+        return cls._from_rows(
+            [tuple(record[name] for name in FEATURE_COLUMNS) for record in records]
+        )
+
+    @classmethod
+    def from_features(
+        cls, items: Sequence[BitAdmitFeatures]
+    ) -> "BitAdmitFeaturesBatch":
+        """Build the batch from per-application feature objects."""
+        return cls._from_rows([item.to_row() for item in items])
+
+    def __len__(self) -> int:
+        return len(self.program_category)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        # copy=False: pandas wraps the column arrays instead of copying them.
+        return pd.DataFrame(
+            {name: getattr(self, name) for name in FEATURE_COLUMNS}, copy=False
+        )
 
 
 class BitAdmitClassifier:
-    def __init__(self, model_path: str = BEST_MODEL_PATH) -> None:
+    def __init__(
+        self, model_path: str = BEST_MODEL_PATH, mmap_mode: Optional[str] = "r"
+    ) -> None:
         try:
-            self.model_bundle = load_object(model_path)
+            # With mmap_mode="r" the fitted arrays stay file-backed: pages are
+            # read on demand and shared between workers via the page cache.
+            self.model_bundle = load_object(model_path, mmap_mode=mmap_mode)
             self.preprocessor = self.model_bundle["preprocessor"]
             self.models = self.model_bundle["models"]
             self.target_columns = self.model_bundle.get(
@@ -49,60 +143,146 @@ class BitAdmitClassifier:
             self.target_value_map: TargetValueMap = self.model_bundle[
                 "target_value_map"
             ]
+            # Fan target models out over threads (their numpy/C work releases
+            # the GIL); with one target or one CPU run them inline instead.
+            max_workers = min(len(self.target_columns), os.cpu_count() or 1)
+            self._pool: Optional[ThreadPoolExecutor] = (
+                ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="bit-admit-predict"
+                )
+                if max_workers > 1
+                else None
+            )
+            self._warm_up()
         except Exception as exc:
             raise BitAdmitAIException(exc, sys) from exc
 
+    def _warm_up(self) -> None:
+        """Run one all-missing row through the preprocessor.
+
+        The first ``transform`` call pays for sklearn's lazy set-up and for
+        faulting in the memory-mapped statistics; doing it here keeps that
+        cost off the first request.
+        """
+        columns = getattr(self.preprocessor, "feature_names_in_", None)
+        if columns is None:
+            return
+        self.preprocessor.transform(
+            pd.DataFrame({column: [np.nan] for column in columns}, dtype=object)
+        )
+
     @staticmethod
     def _prepare_features(df: pd.DataFrame) -> pd.DataFrame:
         processed = df.copy()
 
-        for column in ["program_category", "degree_language", "english_test_type"]:
+        for column in DataTransformation.STANDARDIZED_COLUMNS:
             if column in processed.columns:
                 processed[column] = DataTransformation._standardize_strings(
                     processed[column]
                 )
 
-        if "publication_count" in processed.columns:
-            processed["publication_count"] = np.log1p(
-                processed["publication_count"].astype(float).clip(lower=0)
-            )
-
         if "chinese_proficiency" in processed.columns:
-            standardized = DataTransformation._standardize_strings(
-                processed["chinese_proficiency"]
-            )
             processed["chinese_proficiency"] = (
-                standardized.str.replace("hsk", "", regex=False)
-                .replace("", np.nan)
-                .astype(float)
+                DataTransformation._parse_chinese_proficiency(
+                    processed["chinese_proficiency"]
+                )
             )
 
-        processed["language_requirement_passed"] = processed.apply(
-            DataTransformation._language_requirement_passed, axis=1
-        )
-        processed["weighted_score"] = processed.apply(
-            DataTransformation._weighted_score, axis=1
-        )
+        return processed.assign(**DataTransformation._derive_features(processed))
 
-        return processed
+    def _predict_targets(self, transformed_features) -> Dict[str, np.ndarray]:
+        """Run every target model on the same transformed input."""
+        if self._pool is None:
+            return {
+                target_name: self.models[target_name].predict(transformed_features)
+                for target_name in self.target_columns
+            }
+        futures = {
+            target_name: self._pool.submit(
+                self.models[target_name].predict, transformed_features
+            )
+            for target_name in self.target_columns
+        }
+        return {target_name: future.result() for target_name, future in futures.items()}
 
     def predict(self, features: BitAdmitFeatures) -> Dict[str, str]:
         try:
             input_df = features.to_dataframe()
             engineered_df = self._prepare_features(input_df)
             transformed_features = self.preprocessor.transform(engineered_df)
+            if sparse.issparse(transformed_features):
+                # Models are fitted on dense input; keep inference consistent.
+                transformed_features = transformed_features.toarray()
 
-            predictions: Dict[str, str] = {}
+            # Single-row input: take each target's scalar and index its classes.
+            encoded = {
+                target_name: int(predictions[0])
+                for target_name, predictions in self._predict_targets(
+                    transformed_features
+                ).items()
+            }
+            return {
+                target_name: self.target_value_map.decode_scalar(target_name, value)
+                for target_name, value in encoded.items()
+            }
 
-            for target_name in self.target_columns:
-                model = self.models[target_name]
-                encoded_prediction = model.predict(transformed_features)
-                decoded = self.target_value_map.decode_prediction(
-                    encoded_prediction, [target_name]
-                )
-                predictions[target_name] = decoded[target_name]
+        except Exception as exc:
+            raise BitAdmitAIException(exc, sys) from exc
+
+    def predict_many(self, items: Sequence[BitAdmitFeatures]) -> List[Dict[str, str]]:
+        """Predict every target for a batch of applications.
+
+        Args:
+            items: Applications to score.
 
-            return predictions
+        Returns:
+            List[Dict[str, str]]: One ``{target: label}`` dict per item, in
+            input order.
+
+        Raises:
+            BitAdmitAIException: If preprocessing or prediction fails.
+        """
+        return self.predict_batch(
+            BitAdmitFeaturesBatch.from_features(items).to_dataframe()
+        )
+
+    def predict_batch(self, input_df: pd.DataFrame) -> List[Dict[str, str]]:
+        """Predict every target for a frame of raw application features.
+
+        The batch goes through feature preparation, the preprocessor and each
+        target model once, instead of once per application, and no
+        :class:`BitAdmitFeatures` is built per row.
+
+        Args:
+            input_df: One row per application with the ``BitAdmitFeatures``
+                columns (extra columns are ignored).
+
+        Returns:
+            List[Dict[str, str]]: One ``{target: label}`` dict per row, in
+            input order.
+
+        Raises:
+            BitAdmitAIException: If a feature column is missing, or
+                preprocessing or prediction fails.
+        """
+        try:
+            if input_df.empty:
+                return []
+
+            engineered_df = self._prepare_features(input_df[list(FEATURE_COLUMNS)])
+            transformed_features = self.preprocessor.transform(engineered_df)
+            if sparse.issparse(transformed_features):
+                transformed_features = transformed_features.toarray()
+
+            decoded = {
+                target_name: self.target_value_map.decode_array(
+                    target_name, predictions
+                )
+                for target_name, predictions in self._predict_targets(
+                    transformed_features
+                ).items()
+            }
+            return [dict(zip(decoded, labels)) for labels in zip(*decoded.values())]
 
         except Exception as exc:
             raise BitAdmitAIException(exc, sys) from exc
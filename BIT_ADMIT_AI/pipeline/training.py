@@ -14,6 +14,7 @@ from BIT_ADMIT_AI.entity.config import (
     ModelEvaluationConfig,
     ModelPusherConfig,
 )
+from BIT_ADMIT_AI.utils.main_utils import wait_for_pending_save
 from BIT_ADMIT_AI.entity.artifact import (
     DAArtifacts,
     DataValidationArtifact,
@@ -141,5 +142,9 @@ class TrainingPipline:
             _ = self.start_model_evaluation(
                 model_trainer_artifact=model_trainer_artifact,
             )
+            # The trained model is pickled in the background; block on it
+            # whether or not it was promoted, so the file exists and any save
+            # error reaches the caller before the run counts as a success.
+            wait_for_pending_save(model_trainer_artifact.trained_model_file_path)
         except Exception as e:
             raise BitAdmitAIException(e, sys)
@@ -8,16 +8,15 @@ the in-memory DataFrame. Randomness is seeded for reproducibility.
 
 import pandas as pd
 import numpy as np
-import random
+import pyarrow as pa
+from pyarrow import csv as pacsv
 from datetime import datetime
+from typing import Optional, Tuple
 from BIT_ADMIT_AI.logger import logging
 
 # intializing values(modeled after BIT admission form)
-np.random.seed(42)
-random.seed(42)
 n = 2000
-
-time_string = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+SEED = 42
 
 program_categories = [
     "Undergraduate",
@@ -94,289 +93,371 @@ countries = [
     "Indonesia",
 ]
 english_tests = ["IELTS", "TOEFL", "DUOLINGO"]
-
-
-def select_program(cat: str) -> str:
-    """Select a program given a program category.
+quality_classes = ["low", "mid", "high"]
+degree_languages = ["English-taught", "Chinese-taught"]
+hsk_levels = ["HSK1", "HSK2", "HSK3", "HSK4", "HSK5", "HSK6"]
+
+# Integer category codes used by the target rules (positions in the lists
+# above); comparing codes avoids per-row string compares. Unknown labels
+# get code -1, so they fall below every minimum.
+IELTS_CODE, TOEFL_CODE, DUOLINGO_CODE = (
+    english_tests.index(test) for test in ("IELTS", "TOEFL", "DUOLINGO")
+)
+ENGLISH_TAUGHT_CODE = degree_languages.index("English-taught")
+CHINESE_TAUGHT_CODE = degree_languages.index("Chinese-taught")
+HSK4_CODE = hsk_levels.index("HSK4")
+
+
+def quality_masks(
+    quality_classes: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Boolean (high, mid, low) masks; anything besides high/mid is "low"."""
+    high = np.asarray(quality_classes == "high")
+    mid = np.asarray(quality_classes == "mid")
+    return high, mid, ~(high | mid)
+
+
+def assign_programs_and_languages(
+    categories: np.ndarray, rng: np.random.Generator
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Pick each row's program and teaching language from its category.
+
+    The category masks are built once (from categorical codes) and used for
+    both columns.
 
     Args:
-        cat: Program category. One of {"Undergraduate", "Postgraduate",
-            "Chinese Language", "Dual Degree"}.
+        categories: Array of program categories. One of {"Undergraduate",
+            "Postgraduate", "Chinese Language", "Dual Degree"}; anything else
+            is treated as Dual Degree.
+        rng: Random generator to draw from.
 
     Returns:
-        str: Program name selected uniformly at random within the category.
+        Tuple of:
+        - numpy.ndarray: Program names, uniform within each category (one
+          ``rng.choice`` call per category).
+        - numpy.ndarray: "English-taught" / "Chinese-taught" (70/30 draw).
+          Chinese Language is ofc always "Chinese-taught".
     """
-    if cat == "Undergraduate":
-        return random.choice(undergraduate_programs)
-    if cat == "Postgraduate":
-        return random.choice(postgraduate_programs)
-    if cat == "Chinese Language":
-        return random.choice(chinese_language_programs)
-    return random.choice(dual_degree_programs)
-
-
-def language_logic(cat: str) -> str:
-    """Decide teaching language from the program category.
-
-    Args:
-        cat: Program category.
-
-    Returns:
-        "English-taught" or "Chinese-taught". Chinese Language is ofc always
-        "Chinese-taught".
-    """
-    if cat in ["Undergraduate", "Postgraduate", "Dual Degree"]:
-        return np.random.choice(["English-taught", "Chinese-taught"], p=[0.7, 0.3])
-    return "Chinese-taught"
-
+    codes = pd.Categorical(categories, categories=program_categories).codes
+    is_ug, is_pg, is_cl = (codes == 0), (codes == 1), (codes == 2)
+    is_dd = ~(is_ug | is_pg | is_cl)
+
+    programs = np.empty(len(codes), dtype=object)
+    for mask, choices in (
+        (is_ug, undergraduate_programs),
+        (is_pg, postgraduate_programs),
+        (is_cl, chinese_language_programs),
+        (is_dd, dual_degree_programs),
+    ):
+        programs[mask] = rng.choice(choices, mask.sum())
 
-# For english programs
-def gen_lang_score(test: str, quality_class: str) -> float:
-    """Generate an English test score conditioned on applicant quality.
+    languages = np.full(len(codes), "Chinese-taught", dtype=object)
+    languages[~is_cl] = rng.choice(
+        ["English-taught", "Chinese-taught"], (~is_cl).sum(), p=[0.7, 0.3]
+    )
+    return programs, languages
+
+
+# For english programs: test -> (mean by quality, sd by quality, max score)
+LANG_SCORE_PARAMS = {
+    "TOEFL": (
+        {"high": 105, "mid": 92, "low": 75},
+        {"high": 8, "mid": 12, "low": 20},
+        120,
+    ),
+    "IELTS": (
+        {"high": 7.5, "mid": 6.5, "low": 5.0},
+        {"high": 0.4, "mid": 0.7, "low": 1.0},
+        9,
+    ),
+    "DUOLINGO": (
+        {"high": 125, "mid": 95, "low": 70},
+        {"high": 10, "mid": 20, "low": 30},
+        160,
+    ),
+}
+
+
+def gen_lang_scores(
+    tests: np.ndarray,
+    quality_classes: np.ndarray,
+    rng: np.random.Generator,
+    masks: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None,
+) -> np.ndarray:
+    """Generate English test scores conditioned on applicant quality.
+
+    Per-row mean/sd/upper bound are looked up by (test, quality) and all
+    scores come from a single ``rng.normal`` call.
 
     Args:
-        test: One of {"TOEFL", "IELTS", "DUOLINGO"}.
-        quality_class: Applicant quality band: {"low", "mid", "high"}.
+        tests: Array of {"TOEFL", "IELTS", "DUOLINGO"}.
+        quality_classes: Array of applicant quality bands: {"low", "mid", "high"}.
+        rng: Random generator to draw from.
+        masks: Precomputed ``quality_masks(quality_classes)``, shared across
+            features; computed here when omitted.
 
     Returns:
-        Float score within the test’s valid range. Returns 0.0 for unknown test types.
+        numpy.ndarray of float scores within each test’s valid range; 0.0 for
+        unknown test types.
     """
-    if test == "TOEFL":
-        mean = {"high": 105, "mid": 92, "low": 75}[quality_class]
-        sd = {"high": 8, "mid": 12, "low": 20}[quality_class]
-        return float(np.clip(np.random.normal(mean, sd), 0, 120))
-    if test == "IELTS":
-        mean = {"high": 7.5, "mid": 6.5, "low": 5.0}[quality_class]
-        sd = {"high": 0.4, "mid": 0.7, "low": 1.0}[quality_class]
-        return float(np.clip(np.random.normal(mean, sd), 0, 9))
-    if test == "DUOLINGO":
-        mean = {"high": 125, "mid": 95, "low": 70}[quality_class]
-        sd = {"high": 10, "mid": 20, "low": 30}[quality_class]
-        return float(np.clip(np.random.normal(mean, sd), 0, 160))
-    return 0.0
+    qualities = ("high", "mid", "low")
+    if masks is None:
+        masks = quality_masks(quality_classes)
+    test_masks = [tests == test for test in LANG_SCORE_PARAMS]
+
+    mean = np.select(
+        test_masks,
+        [
+            np.select(masks, [means[q] for q in qualities], 0)
+            for means, _, _ in LANG_SCORE_PARAMS.values()
+        ],
+        0,
+    )
+    sd = np.select(
+        test_masks,
+        [
+            np.select(masks, [sds[q] for q in qualities], 0)
+            for _, sds, _ in LANG_SCORE_PARAMS.values()
+        ],
+        0,
+    )
+    upper = np.select(
+        test_masks, [upper for _, _, upper in LANG_SCORE_PARAMS.values()], 0
+    )
+    return np.clip(rng.normal(mean, sd), 0, upper).astype(float)
 
 
 # for chinise programs(mainly but we gave English lang students HSK1 by default)
-def assign_chinese_proficiency(lang: str, quality_class: str) -> str:
+def assign_chinese_proficiency(
+    languages: np.ndarray,
+    quality_classes: np.ndarray,
+    rng: np.random.Generator,
+    masks: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None,
+) -> np.ndarray:
     """Assign an HSK level based on degree language and quality.
 
+    One ``rng.choice`` draw per (language, quality) bucket.
+
     Args:
-        lang: "English-taught" or "Chinese-taught".
-        quality_class: Applicant quality band: {"low", "mid", "high"}.
+        languages: Array of "English-taught" / "Chinese-taught".
+        quality_classes: Array of applicant quality bands: {"low", "mid", "high"}.
+        rng: Random generator to draw from.
+        masks: Precomputed ``quality_masks(quality_classes)``, shared across
+            features; computed here when omitted.
 
     Returns:
-        HSK level string (HSK1 - HSK6).
+        numpy.ndarray of HSK level strings (HSK1 - HSK6).
     """
-    if lang != "Chinese-taught":
-        return np.random.choice(["HSK1", "HSK2", "HSK3"], p=[0.5, 0.3, 0.2])
-    if quality_class == "high":
-        return np.random.choice(["HSK5", "HSK6"], p=[0.6, 0.4])
-    if quality_class == "mid":
-        return np.random.choice(["HSK4", "HSK5"], p=[0.6, 0.4])
-    return np.random.choice(["HSK3", "HSK4"], p=[0.7, 0.3])
+    high, mid, low = quality_masks(quality_classes) if masks is None else masks
+    chinese_taught = np.asarray(languages == "Chinese-taught")
+    levels = np.empty(len(languages), dtype=object)
+    for mask, choices, p in (
+        (~chinese_taught, ["HSK1", "HSK2", "HSK3"], [0.5, 0.3, 0.2]),
+        (chinese_taught & high, ["HSK5", "HSK6"], [0.6, 0.4]),
+        (chinese_taught & mid, ["HSK4", "HSK5"], [0.6, 0.4]),
+        (chinese_taught & low, ["HSK3", "HSK4"], [0.7, 0.3]),
+    ):
+        levels[mask] = rng.choice(choices, mask.sum(), p=p)
+    return levels
+
+
+def _codes(values: pd.Series, categories: list) -> np.ndarray:
+    return pd.Categorical(values, categories=categories).codes
 
 
 # who passed or failed( Business logic, check the read me for full details)
-def assign_targets(row: pd.Series) -> pd.Series:
+def assign_targets(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
     """Compute admission decision and scholarship tier from applicant features.
 
     Enforces language minima, computes a composite score, and maps it to
-    decision/scholarship outcomes.
+    decision/scholarship outcomes. Evaluated column-wise over the whole frame;
+    the first matching rule wins, as in the original per-row logic.
 
     Args:
-        row: pandas Series with required fields
+        df: DataFrame with the required feature columns.
 
     Returns:
-        pandas.Series of length 2: [admission_decision, scholarship_tier].
+        Tuple of object arrays: (admission_decision, scholarship_tier).
     """
-    if row.previous_gpa < 2.5:
-        return pd.Series(["Rejected", "No Scholarship"])
-    if row.recommendation_strength < 6 or row.interview_score < 60:
-        return pd.Series(["Rejected", "No Scholarship"])
-    if row.degree_language == "English-taught":
-        if (
-            (row.english_test_type == "TOEFL" and row.english_score < 90)
-            or (row.english_test_type == "IELTS" and row.english_score < 6)
-            or (row.english_test_type == "DUOLINGO" and row.english_score < 90)
-        ):
-            return pd.Series(["Rejected", "No Scholarship"])
-    if row.degree_language == "Chinese-taught" and row.chinese_proficiency not in [
-        "HSK4",
-        "HSK5",
-        "HSK6",
-    ]:
-        return pd.Series(["Rejected", "No Scholarship"])
-    gpa = row.previous_gpa / 4
-    rec = row.recommendation_strength / 10
-    inter = row.interview_score / 100
-    research = row.research_alignment_score / 10
-    math = row.math_physics_background_score / 10
-    pub = min(row.publication_count / 5, 1)
-    if row.program_category == "Postgraduate":
-        score = 10 * (0.4 * gpa + 0.3 * research + 0.1 * pub + 0.1 * rec + 0.1 * inter)
-    elif row.program_category == "Undergraduate":
-        score = 10 * (0.4 * gpa + 0.3 * math + 0.1 * rec + 0.2 * inter)
-    else:
-        score = 10 * (0.5 * gpa + 0.2 * rec + 0.3 * inter)
-    if score < 6.5:
-        return pd.Series(["Rejected", "No Scholarship"])
-    if score < 7.5:
-        return pd.Series(["Admitted", "No Scholarship"])
-    if score < 8.5:
-        if row.previous_gpa >= 3.2 and row.recommendation_strength >= 7:
-            return pd.Series(["Admitted", "Partial Scholarship"])
-        return pd.Series(["Admitted", "No Scholarship"])
-    if (
-        row.previous_gpa >= 3.6
-        and row.recommendation_strength >= 8
-        and row.interview_score >= 85
-    ):
-        return pd.Series(["Admitted", "Full Scholarship"])
-    return pd.Series(["Admitted", "Partial Scholarship"])
+    prev_gpa = df["previous_gpa"].to_numpy()
+    rec_strength = df["recommendation_strength"].to_numpy()
+    interview = df["interview_score"].to_numpy()
+    # Categoricals compare against a label via their integer codes (and give
+    # plain boolean arrays whatever the input column dtype).
+    category = pd.Categorical(df["program_category"], categories=program_categories)
+    language = _codes(df["degree_language"], degree_languages)
+    test = _codes(df["english_test_type"], english_tests)
+    english = df["english_score"].to_numpy()
+
+    english_fail = (
+        ((test == TOEFL_CODE) & (english < 90))
+        | ((test == IELTS_CODE) & (english < 6))
+        | ((test == DUOLINGO_CODE) & (english < 90))
+    )
+    # HSK4-HSK6 pass; lower levels and unknown labels (-1) fail.
+    chinese_fail = _codes(df["chinese_proficiency"], hsk_levels) < HSK4_CODE
+    reject = (
+        (prev_gpa < 2.5)
+        | (rec_strength < 6)
+        | (interview < 60)
+        | ((language == ENGLISH_TAUGHT_CODE) & english_fail)
+        | ((language == CHINESE_TAUGHT_CODE) & chinese_fail)
+    )
 
+    gpa = prev_gpa / 4
+    rec = rec_strength / 10
+    inter = interview / 100
+    research = df["research_alignment_score"].to_numpy() / 10
+    math = df["math_physics_background_score"].to_numpy() / 10
+    pub = np.minimum(df["publication_count"].to_numpy() / 5, 1)
+    score = np.select(
+        [category == "Postgraduate", category == "Undergraduate"],
+        [
+            10 * (0.4 * gpa + 0.3 * research + 0.1 * pub + 0.1 * rec + 0.1 * inter),
+            10 * (0.4 * gpa + 0.3 * math + 0.1 * rec + 0.2 * inter),
+        ],
+        10 * (0.5 * gpa + 0.2 * rec + 0.3 * inter),
+    )
 
-def generate_dataset():
+    conditions = [
+        reject | (score < 6.5),
+        score < 7.5,
+        (score < 8.5) & (prev_gpa >= 3.2) & (rec_strength >= 7),
+        score < 8.5,
+        (prev_gpa >= 3.6) & (rec_strength >= 8) & (interview >= 85),
+    ]
+    admission = np.where(conditions[0], "Rejected", "Admitted").astype(object)
+    scholarship = np.select(
+        conditions,
+        [
+            "No Scholarship",
+            "No Scholarship",
+            "Partial Scholarship",
+            "No Scholarship",
+            "Full Scholarship",
+        ],
+        "Partial Scholarship",
+    ).astype(object)
+    return admission, scholarship
+
+
+def generate_dataset(seed: int = SEED):
     """Generate the synthetic admissions dataset and persist it.
 
     Creates n rows (see module constant `n`) data frame and save it in the datasets folder
 
+    Args:
+        seed: Seed for the Generator (PCG64) that feeds every draw. It is
+            created per call, so repeated calls give the same dataset.
+
     Returns:
         pandas.DataFrame with all generated features and labels.
 
     Side Effects:
         Writes CSV to ./dataset/BIT_Admissions_<timestamp>.csv and logs progress.
     """
-    df = pd.DataFrame(
-        {
-            "application_id": [f"BIT2025{str(i).zfill(4)}" for i in range(1, n + 1)],
-            "program_category": np.random.choice(
-                program_categories, n, p=[0.4, 0.35, 0.15, 0.1]
-            ),
-            "country": np.random.choice(countries, n),
-            "quality_class": np.random.choice(
-                ["low", "mid", "high"], n, p=[0.5, 0.35, 0.15]
-            ),
-        }
+    rng = np.random.default_rng(seed)
+    time_string = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+
+    # Low-cardinality string columns are held as categoricals: masks below
+    # compare codes, and the CSV still holds the labels.
+    program_category = pd.Categorical(
+        rng.choice(program_categories, n, p=[0.4, 0.35, 0.15, 0.1]),
+        categories=program_categories,
     )
-    df["bit_program_applied"] = df["program_category"].apply(select_program)
-    df["degree_language"] = df["program_category"].apply(language_logic)
-
-    # GPA - quality correlated
-    df["previous_gpa"] = np.round(
-        np.where(
-            df["quality_class"] == "high",
-            np.random.normal(3.7, 0.15, n),
-            np.where(
-                df["quality_class"] == "mid",
-                np.random.normal(3.2, 0.3, n),
-                np.random.normal(2.6, 0.4, n),
-            ),
-        ),
-        2,
+    country = pd.Categorical(rng.choice(countries, n), categories=countries)
+    quality = pd.Categorical(
+        rng.choice(quality_classes, n, p=[0.5, 0.35, 0.15]),
+        categories=quality_classes,
     )
-
-    # Math/Physics background(CSCA) - The new chinise admission test
-    df["math_physics_background_score"] = np.round(
-        np.clip(
-            np.where(
-                df["quality_class"] == "high",
-                np.random.normal(8.0, 1.0, n),
-                np.where(
-                    df["quality_class"] == "mid",
-                    np.random.normal(6.0, 1.5, n),
-                    np.random.normal(4.5, 1.8, n),
-                ),
-            ),
-            0,
-            10,
+    programs, languages = assign_programs_and_languages(program_category, rng)
+
+    # Quality strata (high, mid, low), built once and shared by every
+    # feature below, including the English and HSK draws: each stratum gets
+    # its own scalar-parameter draw written through its mask.
+    masks = quality_masks(quality)
+    strata = [(mask, int(mask.sum())) for mask in masks]
+
+    def by_quality(draw, *params, dtype=float):
+        # ``params`` are (high, mid, low) triples, e.g. means and sds.
+        values = np.empty(len(quality), dtype=dtype)
+        for (mask, count), stratum_params in zip(strata, zip(*params)):
+            values[mask] = draw(*stratum_params, count)
+        return values
+
+    def quality_score(means, sds, bounds=None, decimals=1):
+        # Clip and round the fresh draw in place: no temporaries per column.
+        values = by_quality(rng.normal, means, sds)
+        if bounds is not None:
+            np.clip(values, *bounds, out=values)
+        return np.round(values, decimals, out=values)
+
+    # Every column is collected first and the frame is built once; the
+    # dict is filled in draw order so the random stream stays the same.
+    columns = {
+        "application_id": np.char.add(
+            "BIT2025", np.char.zfill(np.arange(1, n + 1).astype(str), 4)
+        ).astype(object),
+        "program_category": program_category,
+        "country": country,
+        "bit_program_applied": pd.Categorical(programs),
+        "degree_language": pd.Categorical(languages, categories=degree_languages),
+        # GPA - quality correlated
+        "previous_gpa": quality_score((3.7, 3.2, 2.6), (0.15, 0.3, 0.4), decimals=2),
+        # Math/Physics background(CSCA) - The new chinise admission test
+        "math_physics_background_score": quality_score(
+            (8.0, 6.0, 4.5), (1.0, 1.5, 1.8), (0, 10)
         ),
-        1,
-    )
-
-    # Research alignment - quality correlated
-    df["research_alignment_score"] = np.round(
-        np.clip(
-            np.where(
-                df["quality_class"] == "high",
-                np.random.normal(7.5, 1.2, n),
-                np.where(
-                    df["quality_class"] == "mid",
-                    np.random.normal(5.5, 1.5, n),
-                    np.random.normal(3.8, 1.8, n),
-                ),
-            ),
-            0,
-            10,
+        # Research alignment - quality correlated
+        "research_alignment_score": quality_score(
+            (7.5, 5.5, 3.8), (1.2, 1.5, 1.8), (0, 10)
         ),
-        1,
-    )
-
-    # Publication count - quality correlated
-    df["publication_count"] = np.where(
-        df["quality_class"] == "high",
-        np.random.poisson(1.5, n),
-        np.where(
-            df["quality_class"] == "mid",
-            np.random.poisson(0.5, n),
-            np.random.poisson(0.1, n),
+        # Publication count - quality correlated
+        "publication_count": by_quality(rng.poisson, (1.5, 0.5, 0.1), dtype=np.int64),
+        # Recommendation strength - quality correlated
+        "recommendation_strength": quality_score(
+            (8.5, 7.2, 5.8), (0.8, 1.0, 1.2), (0, 10)
         ),
-    )
-
-    # Recommendation strength - quality correlated
-    df["recommendation_strength"] = np.round(
-        np.clip(
-            np.where(
-                df["quality_class"] == "high",
-                np.random.normal(8.5, 0.8, n),
-                np.where(
-                    df["quality_class"] == "mid",
-                    np.random.normal(7.2, 1.0, n),
-                    np.random.normal(5.8, 1.2, n),
-                ),
-            ),
-            0,
-            10,
+        # Interview score - quality correlated
+        "interview_score": quality_score((88, 78, 65), (8, 10, 12), (0, 100)),
+        "english_test_type": pd.Categorical(
+            rng.choice(english_tests, n, p=[0.4, 0.4, 0.2]), categories=english_tests
         ),
-        1,
+    }
+    columns["english_score"] = gen_lang_scores(
+        columns["english_test_type"], quality, rng, masks
     )
-
-    # Interview score - quality correlated
-    df["interview_score"] = np.round(
-        np.clip(
-            np.where(
-                df["quality_class"] == "high",
-                np.random.normal(88, 8, n),
-                np.where(
-                    df["quality_class"] == "mid",
-                    np.random.normal(78, 10, n),
-                    np.random.normal(65, 12, n),
-                ),
-            ),
-            0,
-            100,
-        ),
-        1,
+    columns["chinese_proficiency"] = pd.Categorical(
+        assign_chinese_proficiency(columns["degree_language"], quality, rng, masks),
+        categories=hsk_levels,
     )
-
-    df["english_test_type"] = np.random.choice(english_tests, n, p=[0.4, 0.4, 0.2])
-    df["english_score"] = [
-        gen_lang_score(t, q)
-        for t, q in zip(df["english_test_type"], df["quality_class"])
-    ]
-    df["chinese_proficiency"] = [
-        assign_chinese_proficiency(l, q)
-        for l, q in zip(df["degree_language"], df["quality_class"])
-    ]
-
-    target = df.apply(assign_targets, axis=1)
-    df["admission_decision"] = target.iloc[:, 0]
-    df["scholarship_tier"] = target.iloc[:, 1]
-
-    # Drop quality_class as it's only a helper, not a real feature
-    df = df.drop(columns=["quality_class"])
+    # quality_class is only a helper, not a real feature, so it never
+    # becomes a column.
+    admission, scholarship = assign_targets(pd.DataFrame(columns, copy=False))
+
+    # Scores are rounded to 1-2 decimals and counts are small, so narrower
+    # dtypes hold the same values. Done after the targets so the rules see
+    # the float64 values the CSV reads back as; english_score stays float64.
+    for column in (
+        "previous_gpa",
+        "math_physics_background_score",
+        "research_alignment_score",
+        "recommendation_strength",
+        "interview_score",
+    ):
+        columns[column] = columns[column].astype(np.float32)
+    columns["publication_count"] = columns["publication_count"].astype(np.int8)
+    columns["admission_decision"] = admission
+    columns["scholarship_tier"] = scholarship
+    df = pd.DataFrame(columns, copy=False)
 
     file_path = f"./dataset/BIT_Admissions_{time_string}.csv"
-    df.to_csv(file_path, index=False)
+    try:
+        # Arrow's columnar C writer; categoricals are written as their labels.
+        pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), file_path)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+        logging.warning("PyArrow CSV write failed (%s), using pandas writer", e)
+        df.to_csv(file_path, index=False)
     return df
 
 
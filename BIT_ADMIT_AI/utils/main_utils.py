@@ -3,29 +3,69 @@ Main utilities for BIT_ADMIT_AI.
 
 Provides:
 - dataset generation wrapper,
-- YAML read/write,
-- dill save/load,
-- NumPy array save/load,
-- small DataFrame helpers.
+- CSV read (PyArrow with pandas fallback),
+- DataFrame read/write as CSV, Parquet or Feather (and header-only reads),
+- YAML read/write, atomic JSON write,
+- object save/load via joblib (atomic writes, optionally on a background
+  thread; loads memory-map NumPy arrays and are memoized per file version),
+- NumPy array save/load (.npy, lz4-compressed Arrow IPC or sparse .npz),
+- small DataFrame helpers (drop columns, dtype downcasting, content
+  fingerprints).
 
 All public helpers raise BitAdmitAIException on failure.
 """
 
+import hashlib
+import io
+import json
 import os
+import pickle
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 import numpy as np
 import dill
+import joblib
 import yaml
+import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pacsv
+from pyarrow import feather
+from pyarrow import parquet as pq
 from pandas import DataFrame
+from scipy import sparse
 
 from BIT_ADMIT_AI.logger import logging
 from BIT_ADMIT_AI.exceptions import BitAdmitAIException
-from BIT_ADMIT_AI.utils.data_generator import generate_dataset as _generate_dataset
+
+# libyaml's C loader/dumper are several times faster; same safe semantics.
+_YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_SAFE_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+# pandas' CSV formatter issues many small writes; flush them in 1 MiB blocks.
+_CSV_WRITE_BUFFER_SIZE = 1 << 20
+# Deserialized objects per (path, mtime, size, mmap mode); a rewritten file misses.
+_OBJECT_CACHE: Dict[Tuple[str, int, int, Optional[str]], object] = {}
+_OBJECT_CACHE_MAX_ENTRIES = 8
+# Parsed YAML per (path, mtime, size), shared by every read_yaml_file caller.
+_YAML_CACHE: Dict[Tuple[str, int, int], object] = {}
+_YAML_CACHE_MAX_ENTRIES = 32
+# Parent directories already created by this process; skips repeat makedirs.
+_ENSURED_DIRS: Set[str] = set()
+
+
+def _ensure_parent_dir(file_path: str) -> None:
+    dir_path = os.path.dirname(os.path.abspath(file_path))
+    if dir_path not in _ENSURED_DIRS:
+        os.makedirs(dir_path, exist_ok=True)
+        _ENSURED_DIRS.add(dir_path)
 
 
 def generate_dataset() -> DataFrame:
     """Generate the synthetic admissions dataset.
 
-    Wraps BIT_ADMIT_AI.utils.data_generator.generate_dataset.
+    Wraps BIT_ADMIT_AI.utils.data_generator.generate_dataset. The generator
+    (and numba, when installed) is imported on first call, so importing
+    these utils does not pay for it.
 
     Returns:
         pandas.DataFrame: Generated dataset.
@@ -34,9 +74,13 @@ def generate_dataset() -> DataFrame:
         BitAdmitAIException: If generation fails.
     """
     try:
+        from BIT_ADMIT_AI.utils.data_generator import (
+            generate_dataset as _generate_dataset,
+        )
+
         return _generate_dataset()
     except Exception as e:
-        logging.error(f"Error occured - {e}")
+        logging.error("Error occured - %s", e)
         raise BitAdmitAIException(e)
 
 
@@ -45,9 +89,211 @@ def generate_project_template() -> None:
     pass
 
 
+def read_csv_file(file_path: str, columns: Optional[List[str]] = None) -> DataFrame:
+    """Read a CSV into a DataFrame using the multi-threaded PyArrow reader.
+
+    String columns come back as Arrow-backed ``string[pyarrow]``; numeric
+    columns keep their NumPy dtypes. Falls back to ``pandas.read_csv`` for
+    files PyArrow cannot parse (e.g. non UTF-8 encodings).
+
+    Args:
+        file_path: Path to the CSV.
+        columns: Optional subset of columns to parse; other fields are skipped
+            without being converted.
+
+    Returns:
+        pandas.DataFrame: Loaded data.
+
+    Raises:
+        BitAdmitAIException: On IO or parse errors.
+    """
+    try:
+        try:
+            with pa.memory_map(file_path, "r") as source:
+                table = pacsv.read_csv(
+                    source,
+                    read_options=pacsv.ReadOptions(
+                        block_size=8 << 20, use_threads=True
+                    ),
+                    convert_options=pacsv.ConvertOptions(include_columns=columns or []),
+                )
+        except pa.ArrowInvalid as e:
+            logging.warning("PyArrow CSV read failed (%s), using pandas reader", e)
+            return pd.read_csv(file_path, usecols=columns)
+
+        return table_to_dataframe(table)
+    except Exception as e:
+        logging.error("Error occured - %s", e)
+        raise BitAdmitAIException(e, sys) from e
+
+
+def table_to_dataframe(table: pa.Table) -> DataFrame:
+    """Convert an Arrow table to pandas, releasing Arrow buffers as it goes.
+
+    String columns map to ``string[pyarrow]``; other columns use NumPy dtypes.
+
+    Args:
+        table: Arrow table to convert (unusable afterwards).
+
+    Returns:
+        pandas.DataFrame: Converted data.
+    """
+    string_dtype = pd.StringDtype("pyarrow")
+    return table.to_pandas(
+        types_mapper={pa.string(): string_dtype, pa.large_string(): string_dtype}.get,
+        split_blocks=True,
+        self_destruct=True,
+    )
+
+
+def read_dataframe(file_path: str, columns: Optional[List[str]] = None) -> DataFrame:
+    """Read a tabular artifact, picking the reader from the file suffix.
+
+    Supports ``.parquet``, ``.feather``/``.arrow`` and falls back to CSV.
+    Files are memory-mapped so Arrow reads straight from the page cache
+    instead of copying the file into a heap buffer first.
+
+    Args:
+        file_path: Path to the file.
+        columns: Optional subset of columns to load (all columns if None).
+
+    Returns:
+        pandas.DataFrame: Loaded data.
+
+    Raises:
+        BitAdmitAIException: On IO or parse errors.
+    """
+    try:
+        suffix = os.path.splitext(file_path)[1].lower()
+        if suffix == ".parquet":
+            return table_to_dataframe(
+                pq.read_table(file_path, columns=columns, memory_map=True)
+            )
+        if suffix in (".feather", ".arrow"):
+            return table_to_dataframe(
+                feather.read_table(file_path, columns=columns, memory_map=True)
+            )
+        return read_csv_file(file_path, columns=columns)
+    except Exception as e:
+        logging.error("Error occured - %s", e)
+        raise BitAdmitAIException(e, sys) from e
+
+
+def read_column_names(file_path: str) -> List[str]:
+    """Read only the column names of a tabular artifact.
+
+    Parquet and Feather names come from the file schema; CSV names come from
+    a streaming reader that parses just the first block. No rows are
+    materialized.
+
+    Args:
+        file_path: Path to a ``.parquet``, ``.feather``/``.arrow`` or CSV file.
+
+    Returns:
+        List[str]: Column names in file order.
+
+    Raises:
+        BitAdmitAIException: On IO or parse errors.
+    """
+    try:
+        suffix = os.path.splitext(file_path)[1].lower()
+        if suffix == ".parquet":
+            return pq.read_schema(file_path).names
+        if suffix in (".feather", ".arrow"):
+            with pa.memory_map(file_path, "r") as source:
+                return pa.ipc.open_file(source).schema.names
+        try:
+            with pa.memory_map(file_path, "r") as source:
+                return pacsv.open_csv(source).schema.names
+        except pa.ArrowInvalid:
+            return pd.read_csv(file_path, nrows=0).columns.tolist()
+    except Exception as e:
+        logging.error("Error occured - %s", e)
+        raise BitAdmitAIException(e, sys) from e
+
+
+def save_dataframe(
+    file_path: str, dataframe: DataFrame, make_dirs: bool = True
+) -> None:
+    """Persist a DataFrame, picking the writer from the file suffix.
+
+    ``.parquet`` is written with zstd, ``.feather``/``.arrow`` with lz4 and
+    anything else as CSV (PyArrow writer, or a buffered ``to_csv`` for frames
+    Arrow cannot convert). Creates parent directories as needed.
+
+    Args:
+        file_path: Destination path.
+        dataframe: DataFrame to persist (index is not written).
+        make_dirs: Create the parent directory first; callers that already
+            ensured it can pass False to skip the filesystem round trip.
+
+    Raises:
+        BitAdmitAIException: On IO or serialization errors.
+    """
+    try:
+        if make_dirs:
+            _ensure_parent_dir(file_path)
+
+        suffix = os.path.splitext(file_path)[1].lower()
+        if suffix in (".parquet", ".feather", ".arrow"):
+            table = pa.Table.from_pandas(dataframe, preserve_index=False)
+            if suffix == ".parquet":
+                pq.write_table(table, file_path, compression="zstd")
+            else:
+                feather.write_feather(table, file_path, compression="lz4")
+            return
+
+        try:
+            pacsv.write_csv(
+                pa.Table.from_pandas(dataframe, preserve_index=False),
+                file_path,
+                write_options=pacsv.WriteOptions(include_header=True),
+            )
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+            logging.warning("PyArrow CSV write failed (%s), using pandas writer", e)
+            with open(file_path, "wb") as raw, io.BufferedWriter(
+                raw, buffer_size=_CSV_WRITE_BUFFER_SIZE
+            ) as buffer:
+                dataframe.to_csv(buffer, index=False, header=True, chunksize=100_000)
+    except Exception as e:
+        logging.error("Error occured - %s", e)
+        raise BitAdmitAIException(e, sys) from e
+
+
+def dataframe_fingerprint(*dataframes: DataFrame, extra: object = None) -> str:
+    """Content hash of one or more DataFrames, used as a cache key.
+
+    Covers column names, dtypes and row values (index excluded), plus the
+    ``repr`` of ``extra`` for any additional parameters the key depends on.
+
+    Args:
+        dataframes: Frames to fingerprint, in order.
+        extra: Optional additional key material.
+
+    Returns:
+        str: 32-character hex digest.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(extra).encode())
+    for dataframe in dataframes:
+        digest.update(
+            repr(
+                (list(dataframe.columns), dataframe.dtypes.astype(str).tolist())
+            ).encode()
+        )
+        digest.update(
+            pd.util.hash_pandas_object(dataframe, index=False).to_numpy().tobytes()
+        )
+    return digest.hexdigest()
+
+
 def read_yaml_file(file_path: str) -> dict:
     """Read a YAML file.
 
+    Parsed content is memoized per (path, mtime, size), so an unchanged file
+    is not re-read or re-parsed; a rewritten file is parsed afresh. Callers
+    must treat the result as read-only.
+
     Args:
         file_path: Path to the YAML file.
 
@@ -58,12 +304,22 @@ def read_yaml_file(file_path: str) -> dict:
         BitAdmitAIException: On IO or YAML parse errors.
     """
     try:
-        with open(file_path, "rb") as yaml_file:
-            return yaml.safe_load(yaml_file)
+        stat = os.stat(file_path)
+        cache_key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+        if cache_key in _YAML_CACHE:
+            return _YAML_CACHE[cache_key]
+
+        with open(file_path, "r", encoding="utf-8") as yaml_file:
+            content = yaml.load(yaml_file, Loader=_YAML_SAFE_LOADER)
+
+        if len(_YAML_CACHE) >= _YAML_CACHE_MAX_ENTRIES:
+            _YAML_CACHE.pop(next(iter(_YAML_CACHE)))  # oldest first
+        _YAML_CACHE[cache_key] = content
+        return content
 
     except Exception as e:
-        logging.error(f"Error occured - {e}")
-        raise BitAdmitAIException(e)
+        logging.error("Error occured - %s", e)
+        raise BitAdmitAIException(e, sys) from e
 
 
 def write_yaml_file(file_path: str, content: object, replace: bool = False) -> None:
@@ -73,7 +329,8 @@ def write_yaml_file(file_path: str, content: object, replace: bool = False) -> N
 
     Args:
         file_path: Output path.
-        content: Serializable content to dump via yaml.dump.
+        content: Plain Python content (dicts, lists, scalars); it is emitted
+            with the libyaml safe dumper and streamed to the file.
         replace: If True, remove an existing file before writing.
 
     Raises:
@@ -83,19 +340,73 @@ def write_yaml_file(file_path: str, content: object, replace: bool = False) -> N
         if replace:
             if os.path.exists(file_path):
                 os.remove(file_path)
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        with open(file_path, "w") as file:
-            yaml.dump(content, file)
+        _ensure_parent_dir(file_path)
+        with open(file_path, "w", encoding="utf-8") as file:
+            yaml.dump(content, file, Dumper=_YAML_SAFE_DUMPER, default_flow_style=False)
     except Exception as e:
-        logging.error(f"Error occured - {e}")
-        raise BitAdmitAIException(e)
+        logging.error("Error occured - %s", e)
+        raise BitAdmitAIException(e, sys) from e
+
+
+def read_json_file(file_path: str) -> dict:
+    """Read a JSON file.
+
+    Args:
+        file_path: Path to the JSON file.
+
+    Returns:
+        dict: Parsed JSON content.
+
+    Raises:
+        BitAdmitAIException: On IO or JSON parse errors.
+    """
+    try:
+        with open(file_path, "rb") as json_file:
+            return json.load(json_file)
+    except Exception as e:
+        logging.error("Error occured - %s", e)
+        raise BitAdmitAIException(e, sys) from e
+
+
+def write_json_file(file_path: str, content: object) -> None:
+    """Atomically write content to a JSON file.
+
+    The content is written compactly to a temporary file in the target
+    directory and renamed over ``file_path``, so readers never observe a
+    partially written file.
+
+    Args:
+        file_path: Output path.
+        content: JSON-serializable content.
+
+    Raises:
+        BitAdmitAIException: On IO or serialization errors.
+    """
+    try:
+        _ensure_parent_dir(file_path)
+        tmp_path = f"{file_path}.tmp"
+        with open(tmp_path, "w") as file:
+            json.dump(content, file, separators=(",", ":"))
+        os.replace(tmp_path, file_path)
+    except Exception as e:
+        logging.error("Error occured - %s", e)
+        raise BitAdmitAIException(e, sys) from e
 
 
-def load_object(file_path: str) -> object:
-    """Load a Python object serialized with dill.
+def load_object(file_path: str, mmap_mode: Optional[str] = "r") -> object:
+    """Load a Python object written by :func:`save_object`.
+
+    NumPy arrays inside the object (tree node tables, scaler statistics, ...)
+    are memory-mapped read-only by default, so only the pages a caller touches
+    are read. Plain pickle/dill files from older runs load as well. Results
+    are memoized by file version (path, mtime, size): loading an unchanged
+    file again returns the same object without unpickling, while a replaced
+    file is read afresh. Callers must treat the result as read-only.
 
     Args:
-        file_path: Path to the dill file.
+        file_path: Path to the serialized file.
+        mmap_mode: ``joblib.load`` mmap mode for the embedded arrays; None
+            loads them fully into memory.
 
     Returns:
         object: Deserialized object.
@@ -106,21 +417,48 @@ def load_object(file_path: str) -> object:
     logging.info("Entered the load_object method of utils")
 
     try:
-
-        with open(file_path, "rb") as file_obj:
-            obj = dill.load(file_obj)
+        wait_for_pending_save(file_path)
+        stat = os.stat(file_path)
+        cache_key = (
+            os.path.abspath(file_path),
+            stat.st_mtime_ns,
+            stat.st_size,
+            mmap_mode,
+        )
+        if cache_key in _OBJECT_CACHE:
+            return _OBJECT_CACHE[cache_key]
+
+        obj = joblib.load(file_path, mmap_mode=mmap_mode)
+
+        if len(_OBJECT_CACHE) >= _OBJECT_CACHE_MAX_ENTRIES:
+            _OBJECT_CACHE.pop(next(iter(_OBJECT_CACHE)))  # oldest first
+        _OBJECT_CACHE[cache_key] = obj
 
         logging.info("Exited the load_object method of utils")
 
         return obj
 
     except Exception as e:
-        logging.error(f"Error occured - {e}")
+        logging.error("Error occured - %s", e)
         raise BitAdmitAIException(e)
 
 
+def _is_arrow_file(file_path: str) -> bool:
+    return os.path.splitext(file_path)[1].lower() in (".arrow", ".feather")
+
+
+def _is_npz_file(file_path: str) -> bool:
+    return os.path.splitext(file_path)[1].lower() == ".npz"
+
+
 def save_numpy_array_data(file_path: str, array: np.ndarray):
-    """Persist a NumPy array (.npy).
+    """Persist a NumPy array or SciPy sparse matrix.
+
+    ``.npz`` paths are written with ``scipy.sparse.save_npz`` (dense input is
+    converted to CSR). ``.arrow``/``.feather`` paths are written as an
+    lz4-compressed Arrow IPC file (one column per array column, original
+    shape kept in the schema metadata); any other path is written with
+    ``np.save`` (.npy). Sparse input is densified for the dense formats.
 
     Args:
         file_path: Destination path.
@@ -130,23 +468,43 @@ def save_numpy_array_data(file_path: str, array: np.ndarray):
         BitAdmitAIException: On IO errors.
     """
     try:
-        dir_path = os.path.dirname(os.path.abspath(file_path))
-        if dir_path:
-            os.makedirs(dir_path, exist_ok=True)
+        _ensure_parent_dir(file_path)
+        if _is_npz_file(file_path):
+            sparse.save_npz(file_path, sparse.csr_matrix(array), compressed=True)
+            return
+        if sparse.issparse(array):
+            array = array.toarray()
+        if _is_arrow_file(file_path):
+            matrix = array.reshape(array.shape[0], -1)
+            table = pa.table(
+                {f"c{i}": matrix[:, i] for i in range(matrix.shape[1])},
+                metadata={"shape": ",".join(map(str, array.shape))},
+            )
+            feather.write_feather(table, file_path, compression="lz4")
+            return
         with open(file_path, "wb") as file_obj:
             np.save(file_obj, array, allow_pickle=False)
     except Exception as e:
-        raise BitAdmitAIException(e)
+        raise BitAdmitAIException(e, sys) from e
+
 
+def load_numpy_array_data(
+    file_path: str, mmap_mode: Optional[str] = None
+) -> np.ndarray:
+    """Load an array saved by save_numpy_array_data.
 
-def load_numpy_array_data(file_path: str) -> np.ndarray:
-    """Load a NumPy array (.npy).
+    With ``mmap_mode`` set, ``.npy`` files are memory-mapped, so the OS pages
+    in only the bytes a caller touches instead of copying the whole file into
+    RAM. The result is then a view of the file: use ``"r"`` when the caller
+    never mutates it, ``"c"`` (copy-on-write) when it may modify in place.
 
     Args:
-        file_path: Path to the .npy file.
+        file_path: Path to the .npy, .npz or .arrow/.feather file.
+        mmap_mode: ``np.load`` mmap mode for .npy files; None (default) does
+            a full in-memory load. Ignored for other formats.
 
     Returns:
-        np.ndarray: Loaded array.
+        np.ndarray: Loaded array (a CSR matrix for .npz files).
 
     Raises:
         BitAdmitAIException: If the file is missing or load fails.
@@ -154,14 +512,28 @@ def load_numpy_array_data(file_path: str) -> np.ndarray:
     try:
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
-        with open(file_path, "rb") as file_obj:
-            return np.load(file_obj, allow_pickle=False)
+        if _is_npz_file(file_path):
+            return sparse.load_npz(file_path).tocsr()
+        if _is_arrow_file(file_path):
+            table = feather.read_table(file_path, memory_map=True)
+            shape = tuple(
+                int(dim) for dim in table.schema.metadata[b"shape"].split(b",")
+            )
+            return np.column_stack(
+                [column.to_numpy() for column in table.columns]
+            ).reshape(shape)
+        return np.load(file_path, mmap_mode=mmap_mode, allow_pickle=False)
     except Exception as e:
-        raise BitAdmitAIException(e)
+        raise BitAdmitAIException(e, sys) from e
 
 
 def save_object(file_path: str, obj: object) -> None:
-    """Serialize a Python object with dill.
+    """Serialize a Python object with joblib (uncompressed).
+
+    Uncompressed joblib files store NumPy arrays inline so :func:`load_object`
+    can memory-map them. Objects joblib's pickler rejects fall back to dill.
+    The file is written to a sibling ``.tmp`` file and renamed into place,
+    so readers never observe a partial file.
 
     Args:
         file_path: Destination path.
@@ -173,11 +545,14 @@ def save_object(file_path: str, obj: object) -> None:
     logging.info("Entered the save_object method of utils")
 
     try:
-        dir_path = os.path.dirname(os.path.abspath(file_path))
-        if dir_path:
-            os.makedirs(dir_path, exist_ok=True)
-        with open(file_path, "wb") as file_obj:
-            dill.dump(obj, file_obj)
+        _ensure_parent_dir(file_path)
+        tmp_path = f"{file_path}.tmp"
+        try:
+            joblib.dump(obj, tmp_path, compress=0, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            with open(tmp_path, "wb") as file_obj:
+                dill.dump(obj, file_obj, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, file_path)
 
         logging.info("Exited the save_object method of utils")
 
@@ -185,26 +560,124 @@ def save_object(file_path: str, obj: object) -> None:
         raise BitAdmitAIException(e)
 
 
+# Background saves keyed by absolute path; readers wait on them.
+_PENDING_SAVES: Dict[str, Future] = {}
+_SAVE_EXECUTOR: Optional[ThreadPoolExecutor] = None
+
+
+def save_object_async(file_path: str, obj: object) -> Future:
+    """Run :func:`save_object` on a background thread.
+
+    ``obj`` must not be mutated until the save completes. :func:`load_object`
+    and :func:`wait_for_pending_save` block on the pending write for the same
+    path; the worker thread is joined at interpreter exit.
+
+    Args:
+        file_path: Destination path.
+        obj: Python object to serialize.
+
+    Returns:
+        Future: Resolves once the file is in place (re-raises save errors).
+    """
+    global _SAVE_EXECUTOR
+    if _SAVE_EXECUTOR is None:
+        _SAVE_EXECUTOR = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="save_object"
+        )
+    future = _SAVE_EXECUTOR.submit(save_object, file_path, obj)
+    _PENDING_SAVES[os.path.abspath(file_path)] = future
+    return future
+
+
+def wait_for_pending_save(file_path: str) -> None:
+    """Block until a background save to ``file_path`` (if any) has finished.
+
+    Args:
+        file_path: Path passed to :func:`save_object_async`.
+
+    Raises:
+        BitAdmitAIException: If the background save failed.
+    """
+    future = _PENDING_SAVES.pop(os.path.abspath(file_path), None)
+    if future is not None:
+        future.result()
+
+
 def drop_columns(df: DataFrame, cols: list) -> DataFrame:
     """Drop columns from a DataFrame.
 
+    The surviving columns are selected by position, which skips the label
+    re-lookup ``DataFrame.drop`` does. Names not in ``df`` are ignored.
+
     Args:
         df: Input DataFrame.
         cols: Column names to drop.
 
     Returns:
-        pandas.DataFrame: DataFrame without the requested columns.
+        pandas.DataFrame: DataFrame without the requested columns; ``df``
+        itself (no copy) when none of ``cols`` is present.
 
     Raises:
         BitAdmitAIException: If dropping fails.
     """
-    logging.info("Entered drop_columns method of utils")
+    if not cols:
+        return df
 
     try:
-        df = df.drop(columns=cols, axis=1, errors="ignore")
+        cols_set = set(cols)
+        keep = [i for i, col in enumerate(df.columns) if col not in cols_set]
+        if len(keep) == df.shape[1]:
+            return df
+        df = df.iloc[:, keep]
 
-        logging.info("Exited the drop_columns method of utils")
+        logging.info("Dropped columns %s in drop_columns method of utils", cols)
 
         return df
     except Exception as e:
         raise BitAdmitAIException(e)
+
+
+def downcast_dtypes(
+    df: DataFrame,
+    columns: Optional[Iterable[str]] = None,
+    categorical_columns: Iterable[str] = (),
+) -> DataFrame:
+    """Shrink numeric columns to the smallest safe dtype.
+
+    float64 columns become float32 and integer columns the narrowest signed
+    integer type that holds their range (``pd.to_numeric(downcast=...)``).
+    ``categorical_columns`` are converted to ``category``, which suits
+    low-cardinality strings.
+
+    Args:
+        df: Input DataFrame.
+        columns: Numeric columns to consider; defaults to every numeric
+            column. Missing or non-numeric names are skipped.
+        categorical_columns: Columns to convert to ``category``.
+
+    Returns:
+        pandas.DataFrame: Downcast frame; ``df`` itself when nothing changes.
+
+    Raises:
+        BitAdmitAIException: If a conversion fails.
+    """
+    try:
+        if columns is None:
+            columns = df.select_dtypes(include="number").columns
+        converted = {}
+        for column in columns:
+            if column not in df.columns:
+                continue
+            dtype = df[column].dtype
+            if dtype == np.float64:
+                converted[column] = df[column].astype(np.float32)
+            elif pd.api.types.is_integer_dtype(dtype) and dtype.itemsize > 1:
+                converted[column] = pd.to_numeric(df[column], downcast="integer")
+        for column in categorical_columns:
+            if column in df.columns and df[column].dtype != "category":
+                converted[column] = df[column].astype("category")
+        if not converted:
+            return df
+        return df.assign(**converted)
+    except Exception as e:
+        raise BitAdmitAIException(e, sys) from e
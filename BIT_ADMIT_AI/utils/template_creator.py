@@ -56,5 +56,5 @@ for pathfile in list_of_files:
         with open(path_name, "w") as file:
             pass
     else:
-        logging.warning(f"{path_name}_file alread exists")
+        logging.warning("%s_file alread exists", path_name)
         continue
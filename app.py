@@ -1,59 +1,125 @@
 """BIT Admit AI FastAPI service.
 
 - Renders the admissions form UI and displays predictions.
-- Exposes a JSON API for inference.
+- Exposes a JSON API for inference (single application or a batch).
 - Uses DataTransformation helpers to compute radar chart metrics.
+
+The prediction stack (pandas, scikit-learn, the model bundle) is imported when
+the model is first loaded, not when this module is imported. Under a server
+with lifespan events that happens at every startup, so the import is only
+moved, not saved; it is deferred to the first request only when the app runs
+without lifespan (e.g. a TestClient used outside a ``with`` block).
 """
 
+import math
+import re
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-import pandas as pd
 from fastapi import FastAPI, Form, Request
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
-from BIT_ADMIT_AI.components.data_transformation import DataTransformation
-from BIT_ADMIT_AI.pipeline.prediction import BitAdmitClassifier, BitAdmitFeatures
+if TYPE_CHECKING:
+    from BIT_ADMIT_AI.pipeline.prediction import BitAdmitClassifier, BitAdmitFeatures
+
+try:
+    import orjson  # noqa: F401
+except ImportError:  # stdlib json encoder
+    APIResponse = JSONResponse
+else:
+    # orjson serializes the prediction payloads in C.
+    APIResponse = ORJSONResponse
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Load the model when the worker starts serving, not at import time.
+    # Large numpy buffers in the bundle are memory-mapped; each worker still
+    # unpickles its own copy of the estimator objects.
+    _get_classifier_for(app)
+    yield
+
 
-app = FastAPI(title="BIT Admit AI")
+app = FastAPI(
+    title="BIT Admit AI", default_response_class=APIResponse, lifespan=lifespan
+)
 
 static_dir = Path(__file__).parent / "static"
-templates = Jinja2Templates(directory=str(Path(__file__).parent / "templates"))
+# Templates ship with the app, so skip mtime checks and never evict from cache.
+templates = Jinja2Templates(
+    directory=str(Path(__file__).parent / "templates"),
+    auto_reload=False,
+    cache_size=-1,
+)
+# Resolved once at import; handlers render it directly instead of looking it
+# up through TemplateResponse on every request.
+_ADMISSION_TEMPLATE = templates.get_template("admission.html")
 
 app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
 
-classifier = BitAdmitClassifier()
+
+def _get_classifier_for(app: FastAPI) -> "BitAdmitClassifier":
+    classifier = getattr(app.state, "classifier", None)
+    if classifier is None:
+        from BIT_ADMIT_AI.pipeline.prediction import BitAdmitClassifier
+
+        classifier = app.state.classifier = BitAdmitClassifier(mmap_mode="r")
+    return classifier
+
+
+def _get_classifier(request: Request) -> "BitAdmitClassifier":
+    # Falls back to a lazy load when the app runs without lifespan events.
+    return _get_classifier_for(request.app)
 
 
-def _compute_language_pass_and_weight(features: BitAdmitFeatures) -> Dict[str, float]:
-    row = pd.Series(features.to_dict())
+# Strips everything but the level digits ("HSK4" -> "4") in a single C pass.
+_NON_DIGITS_RE = re.compile(r"\D+")
 
-    chinese_level = row.get("chinese_proficiency", 0)
+
+def _render_admission(**context: Any) -> HTMLResponse:
+    return HTMLResponse(_ADMISSION_TEMPLATE.render(**context))
+
+
+def _to_float(value: Any) -> float:
+    return math.nan if value is None else float(value)
+
+
+def _compute_language_pass(features: "BitAdmitFeatures") -> float:
+    from BIT_ADMIT_AI.components.data_transformation import DataTransformation
+
+    chinese_level = features.chinese_proficiency
     if isinstance(chinese_level, str):
-        digits = "".join(ch for ch in chinese_level if ch.isdigit())
+        digits = _NON_DIGITS_RE.sub("", chinese_level)
         chinese_level = float(digits) if digits else 0.0
-        row["chinese_proficiency"] = chinese_level
 
-    language_pass = float(DataTransformation._language_requirement_passed(row))  # type: ignore[attr-defined]
-    weighted_score = float(DataTransformation._weighted_score(row))  # type: ignore[attr-defined]
-    return {"language_pass": language_pass, "weighted_score": weighted_score}
+    # The kernels broadcast over scalars, so no single-row frame is needed.
+    # Null scores become NaN, which fails every minimum.
+    return float(
+        DataTransformation._language_requirement_passed(  # type: ignore[attr-defined]
+            features.degree_language,
+            features.english_test_type,
+            _to_float(features.english_score),
+            _to_float(chinese_level),
+        )
+    )
 
 
-def _calculate_radar_data(features: BitAdmitFeatures) -> list[float]:
-    metrics = _compute_language_pass_and_weight(features)
-    data_points = [
+def _calculate_radar_data(features: "BitAdmitFeatures") -> list[float]:
+    # Plain scalar min() calls: for six values this beats building a NumPy
+    # array, and the radar only needs the language check, not the score.
+    return [
         min(float(features.previous_gpa) / 4.0, 1.0),
         min(float(features.math_physics_background_score) / 10.0, 1.0),
         min(float(features.research_alignment_score) / 10.0, 1.0),
         min(float(features.publication_count) / 5.0, 1.0),
         min(float(features.recommendation_strength) / 10.0, 1.0),
         min(float(features.interview_score) / 100.0, 1.0),
-        metrics["language_pass"],
+        _compute_language_pass(features),
     ]
-    return data_points
 
 
 @app.get("/", response_class=HTMLResponse)
@@ -66,15 +132,12 @@ async def read_root(request: Request) -> HTMLResponse:
     Returns:
         HTMLResponse: admission.html with empty state.
     """
-    return templates.TemplateResponse(
-        "admission.html",
-        {
-            "request": request,
-            "predictions": None,
-            "input_data": {},
-            "radar_data": None,
-            "prediction_timestamp": "Awaiting input...",
-        },
+    return _render_admission(
+        request=request,
+        predictions=None,
+        input_data={},
+        radar_data=None,
+        prediction_timestamp="Awaiting input...",
     )
 
 
@@ -116,6 +179,8 @@ async def predict(  # pylint: disable=too-many-arguments
     Returns:
         HTMLResponse: admission.html with predictions and radar chart data.
     """
+    from BIT_ADMIT_AI.pipeline.prediction import BitAdmitFeatures
+
     english_score_value = (
         float(english_score.strip()) if english_score and english_score.strip() else 0.0
     )
@@ -136,7 +201,7 @@ async def predict(  # pylint: disable=too-many-arguments
         chinese_proficiency=chinese_proficiency,
     )
 
-    predictions = classifier.predict(features)
+    predictions = _get_classifier(request).predict(features)
     radar_data = _calculate_radar_data(features)
     timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
 
@@ -145,36 +210,71 @@ async def predict(  # pylint: disable=too-many-arguments
         input_snapshot["english_score"] = ""
         input_snapshot["english_test_type"] = ""
 
-    return templates.TemplateResponse(
-        "admission.html",
-        {
-            "request": request,
-            "predictions": predictions,
-            "input_data": input_snapshot,
-            "radar_data": radar_data,
-            "prediction_timestamp": timestamp,
-        },
+    return _render_admission(
+        request=request,
+        predictions=predictions,
+        input_data=input_snapshot,
+        radar_data=radar_data,
+        prediction_timestamp=timestamp,
     )
 
 
-@app.post("/predict-json", response_class=JSONResponse)
-async def predict_json(payload: Dict[str, Any]) -> JSONResponse:
+@app.post("/predict-json", response_class=APIResponse)
+async def predict_json(request: Request, payload: Dict[str, Any]) -> JSONResponse:
     """Predict via JSON payload.
 
     Args:
+        request: FastAPI Request (gives access to the loaded classifier).
         payload: BitAdmitFeatures as a JSON dict.
 
     Returns:
         JSONResponse: predictions, radar_data, and ISO timestamp.
     """
+    from BIT_ADMIT_AI.pipeline.prediction import BitAdmitFeatures
+
     features = BitAdmitFeatures(**payload)
-    predictions = classifier.predict(features)
+    predictions = _get_classifier(request).predict(features)
     radar_data = _calculate_radar_data(features)
     timestamp = datetime.utcnow().isoformat()
-    return JSONResponse(
+    return APIResponse(
         {
             "predictions": predictions,
             "radar_data": radar_data,
             "timestamp": timestamp,
         }
     )
+
+
+@app.post("/predict-batch", response_class=APIResponse)
+async def predict_batch(
+    request: Request, payload: List[Dict[str, Any]]
+) -> JSONResponse:
+    """Predict a batch of applications in one call.
+
+    The rows are scored as one frame, so feature preparation and every model
+    run once for the whole batch rather than once per application.
+
+    Args:
+        request: FastAPI Request (gives access to the loaded classifier).
+        payload: List of BitAdmitFeatures JSON dicts.
+
+    Returns:
+        JSONResponse: predictions (one dict per application, in order) and ISO
+        timestamp.
+    """
+    from BIT_ADMIT_AI.pipeline.prediction import BitAdmitFeaturesBatch
+
+    batch = BitAdmitFeaturesBatch.from_records(payload)
+    predictions = _get_classifier(request).predict_batch(batch.to_dataframe())
+    timestamp = datetime.utcnow().isoformat()
+    return APIResponse({"predictions": predictions, "timestamp": timestamp})
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    from BIT_ADMIT_AI.constant import APP_HOST, APP_PORT
+
+    # "auto" picks uvloop and httptools when installed (uvicorn[standard]) and
+    # falls back to asyncio / h11 otherwise.
+    uvicorn.run("app:app", host=APP_HOST, port=APP_PORT, loop="auto", http="auto")
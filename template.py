@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import logging
 
@@ -41,16 +42,32 @@ list_of_files = [
     "dataset/",
 ]
 
+
+def create_file(path_name: Path) -> None:
+    # "x" creates the file atomically and fails if it exists, so existing
+    # files (empty or not) are never truncated and no separate stat is needed.
+    try:
+        with open(path_name, "x"):
+            pass
+    except FileExistsError:
+        logger.warning("%s file already exists", path_name)
+
+
+# Directories first (deduplicated, in the main thread), then the files.
+file_paths = []
+dir_names = {}
 for pathfile in list_of_files:
+    if pathfile.endswith("/"):
+        # Trailing slash marks a directory entry, e.g. "dataset/".
+        dir_names[pathfile] = None
+        continue
     path_name = Path(pathfile)
+    dir_names[str(path_name.parent)] = None
+    file_paths.append(path_name)
 
-    dir_name, file_name = os.path.split(path_name)
+for dir_name in dir_names:
+    os.makedirs(dir_name, exist_ok=True)
 
-    if dir_name != "":
-        os.makedirs(dir_name, exist_ok=True)
-    if not os.path.exists(path_name) or os.path.getsize(path_name) != 0:
-        with open(path_name, "w") as file:
-            pass
-    else:
-        logger.warning(f"{path_name}_file alread exists")
-        continue
+# The creates are independent, so overlap their filesystem round trips.
+with ThreadPoolExecutor(max_workers=8) as executor:
+    list(executor.map(create_file, file_paths))
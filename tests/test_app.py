@@ -0,0 +1,38 @@
+"""Radar-chart language check in app.py for payloads with null fields."""
+
+from app import _compute_language_pass
+from BIT_ADMIT_AI.pipeline.prediction import BitAdmitFeatures
+
+
+def _features(**overrides) -> BitAdmitFeatures:
+    values = dict(
+        program_category="Undergraduate",
+        country="India",
+        bit_program_applied="Computer Science",
+        degree_language="english_taught",
+        previous_gpa=3.5,
+        math_physics_background_score=8.0,
+        research_alignment_score=6.0,
+        publication_count=1.0,
+        recommendation_strength=8.0,
+        interview_score=85.0,
+        english_test_type="ielts",
+        english_score=7.0,
+        chinese_proficiency="HSK3",
+    )
+    values.update(overrides)
+    return BitAdmitFeatures(**values)
+
+
+def test_language_pass_for_complete_payload():
+    assert _compute_language_pass(_features()) == 1.0
+
+
+def test_language_pass_with_null_english_fields():
+    features = _features(english_test_type=None, english_score=None)
+    assert _compute_language_pass(features) == 0.0
+
+
+def test_language_pass_with_null_hsk_level():
+    features = _features(degree_language="chinese_taught", chinese_proficiency=None)
+    assert _compute_language_pass(features) == 0.0